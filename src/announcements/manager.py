@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from ..audio.playback import AudioPlayer
 
@@ -7,31 +8,38 @@ class AnnouncementManager:
         self.tts_manager = tts_manager
         self.config = config
         self.logger = logger or logging.getLogger(__name__)
+        self._play_lock = asyncio.Lock()
         
     async def play_announcement(self, text: str, source: str = "unknown"):
         """Play an announcement in the voice channel"""
-        self.logger.info("Starting announcement playback")
-        self.logger.info(f"Called from {source} - looking for voice channel")
-        
-        try:
-            # Find voice client
-            voice_client = await self._get_voice_client()
-            if not voice_client:
-                raise Exception("Bot is not in a voice channel and couldn't connect to one")
-                
-            # Create audio player
-            player = AudioPlayer(voice_client, self.tts_manager, self.logger.info)
+        # Skip overlapping requests instead of queueing them behind the current one
+        if self._play_lock.locked():
+            self.logger.info(f"Announcement already playing, skipping request from {source}")
+            return False
             
-            # Play the announcement with notification sound
-            success = await player.play_text(text, play_notification=True)
+        async with self._play_lock:
+            self.logger.info("Starting announcement playback")
+            self.logger.info(f"Called from {source} - looking for voice channel")
             
-            if success:
-                self.logger.info("Announcement completed successfully")
-            else:
-                self.logger.error("Failed to play announcement")
+            try:
+                # Find voice client
+                voice_client = await self._get_voice_client()
+                if not voice_client:
+                    raise Exception("Bot is not in a voice channel and couldn't connect to one")
+                    
+                # Create audio player
+                player = AudioPlayer(voice_client, self.tts_manager, self.logger.info)
                 
-            return success
-            
-        except Exception as e:
-            self.logger.error(f"Error in announcement playback: {e}")
-            raise 
\ No newline at end of file
+                # Play the announcement with notification sound
+                success = await player.play_text(text, play_notification=True)
+                
+                if success:
+                    self.logger.info("Announcement completed successfully")
+                else:
+                    self.logger.error("Failed to play announcement")
+                    
+                return success
+                
+            except Exception as e:
+                self.logger.error(f"Error in announcement playback: {e}")
+                raise 
\ No newline at end of file
@@ -1,17 +1,50 @@
 import discord
-from discord.ext import commands, voice_recv, tasks
+from discord.ext import commands, voice_recv
 import asyncio
 import datetime
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, List, Tuple
 from src.audio.tts import TTSManager
 from src.audio.playback import AudioPlayer
-from src.utils.led_control import LEDController
+from src.utils.led_control import LEDController, LEDConfig
 import numpy as np
 import threading
 import time
 import functools
 import logging
-import math
+import random
+import openai
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+logger = logging.getLogger(__name__)
+
+# Voice latency reads infinity before the first heartbeat ack
+INF = float('inf')
+
+def _noop(*args, **kwargs):
+    """Stand-in for missing UI callbacks"""
+
+
+# Optional methods the bot calls on its ui_callbacks object
+UI_CALLBACK_NAMES = ('update_latency', 'update_connection_status', 'update_voice_connection',
+                     'on_connection_status', 'on_reconnect_completed')
+
+# Connection attempts made by _force_direct_connect before giving up
+FORCE_CONNECT_ATTEMPTS = 3
+
+# Upper bound on concurrent voice connection workers
+MAX_CONNECT_WORKERS = 4
+
+# Speakers MySink remembers as target / not target
+USER_CACHE_SIZE = 64
+
+# Color MySink uses to ask for the LED to be turned off (colors are packed as 0xRRGGBB)
+LED_OFF = 0
+
+def _pack_rgb(rgb: Tuple[int, int, int]) -> int:
+    """Pack an (red, green, blue) tuple into a single 0xRRGGBB int"""
+    red, green, blue = rgb
+    return (red << 16) | (green << 8) | blue
 
 # Monkey patch the voice_recv library to handle None channel_id
 original_on_voice_state_update = voice_recv.VoiceRecvClient.on_voice_state_update
@@ -28,8 +61,8 @@ async def safe_on_voice_state_update(self, data):
         
         # Call the original method
         await original_on_voice_state_update(self, data)
-    except Exception as e:
-        print(f"Error in voice state update handler (monkey patched): {e}")
+    except Exception:
+        logger.exception("Error in voice state update handler (monkey patched)")
 
 # Apply the monkey patch
 voice_recv.VoiceRecvClient.on_voice_state_update = safe_on_voice_state_update
@@ -56,23 +89,56 @@ class DiscordBot(commands.Bot):
         self.debug_print = debug_print_func
         self.status_callback = status_callback
         self.channel_callback = channel_callback
+        self.ui_callbacks = None
         self.led_controller = LEDController(debug_print_func)
+        # Worker pool for the bot's blocking BlinkStick writes (power-on in setup_hook, LED cleanup) so
+        # they stay off the event loop; owned by this bot and shut down in cleanup(). USB writes are
+        # serialized by LEDController itself
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="bot-io")
         self.tts_manager = TTSManager(config.get('openai_api_key', ''), debug_print_func)
-        self._scheduled_announcement_task_started = False
+        self._announcement_task: Optional[asyncio.Task] = None  # Sleeps until the next announcement
+        self._status_refresh_task: Optional[asyncio.Task] = None
         
         # Voice client management
         self._voice_clients = {}  # guild_id -> voice_client
-        self._connection_queue = asyncio.Queue()
-        self._connection_lock = asyncio.Lock()
+        # Latest pending connection intent per guild: guild_id -> (channel_id, target member).
+        # A newer intent for the same guild replaces the pending one instead of queueing behind it.
+        self._pending_intent: Dict[int, Tuple[int, Optional[discord.Member]]] = {}
+        self._intent_event = asyncio.Event()
+        self._connection_locks: Dict[int, asyncio.Lock] = {}  # guild_id -> lock
         self._connection_tasks = {}
         self._current_channel_id = None
-        self._connection_manager_task = None
+        self._connection_workers: List[asyncio.Task] = []
+        self._disconnected_events: Dict[int, asyncio.Event] = {}  # guild_id -> set when we leave voice
+        self._voice_ready: Dict[int, asyncio.Event] = {}  # guild_id -> set while Discord reports us in voice
+        self._last_latency_ms: Dict[int, int] = {}  # guild_id -> latency last sent to the UI
+        self._last_ui_state = (None, None, None)  # (status, channel, latency_ms) last sent by the periodic refresh
+        self._latency_getters: Dict[int, Callable[[], float]] = {}  # guild_id -> latency accessor
+        self._audio_players: Dict[int, Tuple[Any, AudioPlayer]] = {}  # guild_id -> (voice_client, player)
+        
+        # Target user lookup: resolved id and per-guild index of
+        # lowercased name / name#discriminator -> member (the lowercased target is bound in reload_config)
+        self._target_user_id: Optional[int] = None  # Resolved from the member index
+        self._member_index: Dict[int, Dict[str, discord.Member]] = {}
+        # (guild_id, channel_id) -> channel, dropped when the channel is updated or deleted and
+        # per guild on on_guild_remove. A plain dict: discord.py channels use __slots__ without
+        # __weakref__, so they can't live in a WeakValueDictionary
+        self._channel_cache: Dict[Tuple[int, int], discord.abc.GuildChannel] = {}
         
         # Initialize task tracking
         self.running_tasks = []
         self.scheduled_announcements = []
+        self._announcement_lock = asyncio.Lock()
+        self._ui_ready_event = asyncio.Event()  # Set once the UI has applied the connected status
+        self._openai_client = None  # Created on the first chat message
+        self._tts_task: Optional[asyncio.Task] = None  # Chat reply currently being spoken
+        self._pending_ui_state: Dict[str, Any] = {}  # Latest UI state waiting to be flushed
+        self._ui_flush_handle: Optional[asyncio.TimerHandle] = None
         self._loop = loop
         
+        # Bind frequently read settings; reload_config() refreshes them after the config changes
+        self.reload_config()
+        
         # Register event handlers
         self.setup_events()
         
@@ -81,11 +147,15 @@ class DiscordBot(commands.Bot):
         async def on_ready():
             self.debug_print(f"Bot is ready! Logged in as {self.user.name} ({self.user.id})")
             # Update status immediately on connection to Discord
+            self._ui_ready_event.clear()
             if self.status_callback:
                 self.status_callback("Connected to Discord")
             
-            # Small delay to ensure UI can update
-            await asyncio.sleep(0.5)
+            # Give the UI a chance to show the status, but don't wait on it for long
+            try:
+                await asyncio.wait_for(self._ui_ready_event.wait(), timeout=0.5)
+            except asyncio.TimeoutError:
+                pass
             
             # Now check for guilds where the target user is present
             await self._check_all_guilds()
@@ -93,15 +163,33 @@ class DiscordBot(commands.Bot):
         @self.event
         async def on_voice_state_update(member, before, after):
             """Handle voice state updates"""
+            # Mute/deafen toggles of other members don't change channel and need no handling
+            if before.channel is after.channel and member.id != self.user.id:
+                return
+                
             try:
                 # Process updates for our bot
                 if member.id == self.user.id:
+                    # Let waiters know whether Discord has us in a voice channel of this guild
+                    if after.channel is not None:
+                        self._voice_ready_for(after.channel.guild.id).set()
+                    elif before.channel is not None:
+                        self._voice_ready_for(before.channel.guild.id).clear()
+                        
                     # Handle channel changes
                     if before.channel != after.channel:
                         # Handle leaving a channel
                         if before.channel and hasattr(before.channel, 'id') and before.channel.id:
                             try:
                                 guild_id = before.channel.guild.id
+                                if not after.channel:
+                                    # Discord is authoritative: forget everything tied to this connection
+                                    self._latency_getters.pop(guild_id, None)
+                                    self._audio_players.pop(guild_id, None)
+                                    # Wake anyone waiting for this disconnect to complete
+                                    disconnected = self._disconnected_events.get(guild_id)
+                                    if disconnected:
+                                        disconnected.set()
                                 if guild_id in self._voice_clients:
                                     voice_client = self._voice_clients[guild_id]
                                     if voice_client and voice_client.is_connected():
@@ -112,7 +200,7 @@ class DiscordBot(commands.Bot):
                                             await voice_client.disconnect()
                                         except Exception as e:
                                             self.debug_print(f"Error disconnecting from channel {before.channel.id}: {e}")
-                                    del self._voice_clients[guild_id]
+                                    self._voice_clients.pop(guild_id, None)
                             except (ValueError, TypeError) as e:
                                 self.debug_print(f"Error handling voice state update (before): {e}")
                         
@@ -121,15 +209,20 @@ class DiscordBot(commands.Bot):
                             try:
                                 guild_id = after.channel.guild.id
                                 if guild_id not in self._voice_clients:
-                                    # Add connection request to queue
-                                    await self._connection_queue.put((guild_id, after.channel.id, None))
+                                    # Record connection request
+                                    self._request_connection(guild_id, after.channel.id)
                             except (ValueError, TypeError) as e:
                                 self.debug_print(f"Error handling voice state update (after): {e}")
                     return
                 
-                # Check if the member is the target user
-                target_user = self.config.get('target_user', '').lower()
-                is_target_user = member.name.lower() == target_user or str(member).lower() == target_user
+                # Check if the member is the target user: one id compare once resolved,
+                # name compare only until then
+                if self._target_user_id is not None:
+                    is_target_user = member.id == self._target_user_id
+                else:
+                    is_target_user = self._target_lower in self._member_keys(member)
+                    if is_target_user:
+                        self._target_user_id = member.id
                 
                 if is_target_user:
                     # Target user has left a voice channel
@@ -164,98 +257,81 @@ class DiscordBot(commands.Bot):
                                 return
                             
                             # Cancel any pending connection requests to avoid conflicts
-                            while not self._connection_queue.empty():
-                                try:
-                                    self._connection_queue.get_nowait()
-                                    self.debug_print("Cleared a pending connection request from queue")
-                                except asyncio.QueueEmpty:
-                                    break
-                            
-                            # Check if guild still has a voice client with lingering connection
-                            if guild.voice_client:
-                                self.debug_print(f"Found existing voice client in guild, disconnecting first")
-                                try:
-                                    await guild.voice_client.disconnect(force=True)
-                                    # Clear any references to this voice client
-                                    if guild_id in self._voice_clients:
-                                        del self._voice_clients[guild_id]
-                                    await asyncio.sleep(1.0)  # Longer delay to ensure disconnect completes
-                                except Exception as e:
-                                    self.debug_print(f"Error disconnecting existing voice client: {e}")
+                            if self._reset_pending_connections():
+                                self.debug_print("Cleared pending connection requests")
                             
-                            # Connect directly to the channel
-                            self.debug_print(f"Directly connecting to channel {channel.name}")
-                            try:
-                                # Connect with a timeout
-                                voice_client = await asyncio.wait_for(
-                                    channel.connect(cls=voice_recv.VoiceRecvClient),
-                                    timeout=10.0
-                                )
-                                
-                                self.debug_print(f"Successfully connected to voice channel {channel.name}")
-                                self._voice_clients[guild_id] = voice_client
-                                self._current_channel_id = channel_id
+                            # Serialize with the connection workers and direct connects for this guild
+                            async with self._connection_lock_for(guild_id):
+                                # Check if guild still has a voice client with lingering connection
+                                if guild.voice_client:
+                                    self.debug_print(f"Found existing voice client in guild, disconnecting first")
+                                    try:
+                                        # Clear any references to this voice client
+                                        self._voice_clients.pop(guild_id, None)
+                                        await self._disconnect_and_wait(guild_id, guild.voice_client, force=True)
+                                    except Exception as e:
+                                        self.debug_print(f"Error disconnecting existing voice client: {e}")
                                 
-                                # Setup audio sink
-                                if not hasattr(voice_client, 'sink'):
-                                    voice_client.sink = MySink(
-                                        self.tts_manager,
-                                        self.led_controller,
-                                        self.config, 
-                                        self.debug_print
-                                    )
-                                    voice_client.listen(voice_client.sink)
-                                    
-                                # Update UI with connection status
-                                if self.status_callback:
-                                    self.status_callback("Connected to Discord")
-                                if self.channel_callback:
-                                    channel_name = channel.name if hasattr(channel, 'name') else f"Channel {channel_id}"
-                                    self.channel_callback(f"{channel_name}")
-                                    
-                                # Set connected flag in UI if available
-                                if hasattr(self, 'ui_callbacks') and self.ui_callbacks:
-                                    if hasattr(self.ui_callbacks, 'update_connection_status'):
-                                        self.ui_callbacks.update_connection_status(True)
-                                    elif hasattr(self.ui_callbacks, 'on_connection_status'):
-                                        self.ui_callbacks.on_connection_status(True, f"Connected to {channel.name}")
-                                    
-                                # Schedule a status update after 1 second to ensure UI reflects correct state
-                                self.loop.create_task(self._delayed_status_update(guild_id, channel_id))
-                                
-                            except asyncio.TimeoutError:
-                                self.debug_print(f"Connection to channel {channel.name} timed out")
-                            except Exception as e:
-                                self.debug_print(f"Error connecting to channel: {e}")
+                                # Connect directly to the channel
+                                self.debug_print(f"Directly connecting to channel {channel.name}")
+                                await self._perform_connect(guild, channel)
                         except Exception as e:
                             self.debug_print(f"Error handling target user channel join: {e}")
                 
             except Exception as e:
                 self.debug_print(f"Error in voice state update handler: {e}")
                 
+        @self.event
+        async def on_member_join(member):
+            self._index_member(member)
+            
+        @self.event
+        async def on_member_remove(member):
+            self._unindex_member(member, member.guild.id)
+            
+        @self.event
+        async def on_member_update(before, after):
+            self._unindex_member(before, before.guild.id)
+            self._index_member(after)
+            
+        @self.event
+        async def on_user_update(before, after):
+            """Username changes arrive as user updates, so refresh every indexed guild"""
+            for guild_id in list(self._member_index):
+                self._unindex_member(before, guild_id)
+                guild = self.get_guild(guild_id)
+                member = guild.get_member(after.id) if guild else None
+                if member:
+                    self._index_member(member)
+            
+        @self.event
+        async def on_guild_channel_delete(channel):
+            self._channel_cache.pop((channel.guild.id, channel.id), None)
+            
+        @self.event
+        async def on_guild_channel_update(before, after):
+            self._channel_cache.pop((before.guild.id, before.id), None)
+            
+        @self.event
+        async def on_guild_remove(guild):
+            """Forget cached channels and members of a guild we left"""
+            for key in [key for key in self._channel_cache if key[0] == guild.id]:
+                del self._channel_cache[key]
+            self._member_index.pop(guild.id, None)
+            
         @self.event
         async def on_disconnect():
             """Handle bot disconnection"""
             try:
                 # Clear all voice clients
-                for guild_id, voice_client in list(self._voice_clients.items()):
-                    try:
-                        if voice_client and voice_client.is_connected():
-                            # Clear voice state handlers first
-                            if hasattr(voice_client, '_voice_state_update_handler'):
-                                voice_client._voice_state_update_handler = None
-                            await voice_client.disconnect()
-                    except Exception as e:
-                        self.debug_print(f"Error disconnecting voice client {guild_id}: {e}")
-                    finally:
-                        del self._voice_clients[guild_id]
+                await self._disconnect_tracked_clients()
                 
-                # Clear connection queue
-                while not self._connection_queue.empty():
-                    try:
-                        self._connection_queue.get_nowait()
-                    except asyncio.QueueEmpty:
-                        break
+                # Clear pending connection requests
+                self._reset_pending_connections()
+                self._latency_getters.clear()
+                self._audio_players.clear()
+                for voice_ready in self._voice_ready.values():
+                    voice_ready.clear()
                         
                 # Clear current channel
                 self._current_channel_id = None
@@ -266,11 +342,19 @@ class DiscordBot(commands.Bot):
     async def _check_all_guilds(self):
         """Check all guilds for the target user"""
         self.debug_print("Checking all guilds for target user...")
-        connected = False
-        for guild in self.guilds:
-            self.debug_print(f"Checking guild: {guild.name} (ID: {guild.id})")
-            if await self._try_connect_to_target_user(guild):
-                connected = True
+        guilds = list(self.guilds)
+        if self._debug_mode:
+            for guild in guilds:
+                self.debug_print(f"Checking guild: {guild.name} (ID: {guild.id})")
+            
+        # Guilds are independent, so check them concurrently; actual connects are
+        # still serialized per guild by the connection workers
+        results = await asyncio.gather(*(self._try_connect_to_target_user(guild) for guild in guilds),
+                                       return_exceptions=True)
+        for guild, result in zip(guilds, results):
+            if isinstance(result, Exception):
+                self.debug_print(f"Error checking guild {guild.name}: {result}")
+        connected = any(result is True for result in results)
                 
         # Force channel status update for any existing connections
         await self._refresh_connection_status()
@@ -281,51 +365,32 @@ class DiscordBot(commands.Bot):
         """Refresh the UI status based on current connections"""
         try:
             # Check for any active connections
-            for guild_id, voice_client in list(self._voice_clients.items()):
-                if voice_client and voice_client.is_connected() and voice_client.channel:
+            # Tracked clients are dropped as soon as Discord reports that we left the channel
+            for guild_id, voice_client in self._voice_clients.items():
+                if voice_client and voice_client.channel:
                     # Found an active connection, update the UI
-                    # Use a more detailed debug level check to avoid cluttering logs
-                    if self.config.get('debug_mode', False):
+                    # Only logged in debug mode to avoid cluttering logs
+                    if self._debug_mode:
                         self.debug_print(f"Found active connection in channel {voice_client.channel.id}")
                     
                     # Get connection latency if available
-                    latency_ms = 0
-                    if hasattr(voice_client, 'latency'):
-                        try:
-                            if isinstance(voice_client.latency, float):
-                                # Check for infinity or NaN before converting to int
-                                if math.isinf(voice_client.latency) or math.isnan(voice_client.latency):
-                                    self.debug_print("Voice latency is infinity or NaN, setting to 0")
-                                    latency_ms = 0
-                                else:
-                                    latency_ms = int(voice_client.latency * 1000)
-                            elif callable(voice_client.latency):
-                                latency_value = voice_client.latency()
-                                # Check for infinity or NaN before converting to int
-                                if isinstance(latency_value, float) and (math.isinf(latency_value) or math.isnan(latency_value)):
-                                    self.debug_print("Voice latency is infinity or NaN, setting to 0")
-                                    latency_ms = 0
-                                else:
-                                    latency_ms = int(latency_value * 1000)
-                        except Exception as e:
-                            self.debug_print(f"Error getting latency: {e}")
+                    latency_ms = self._latency_ms(guild_id, voice_client)
                     
-                    # Update the UI
-                    if self.status_callback:
-                        self.status_callback("Connected to Discord")
-                    if self.channel_callback:
-                        # Use the channel name rather than ID for better user experience
-                        channel_name = voice_client.channel.name if hasattr(voice_client.channel, 'name') else f"Channel {voice_client.channel.id}"
-                        self.channel_callback(f"{channel_name}")
+                    # Update the UI; use the channel name rather than ID for better user experience
+                    channel_name = voice_client.channel.name if hasattr(voice_client.channel, 'name') else f"Channel {voice_client.channel.id}"
+                    self._publish_ui_state(status="Connected to Discord", channel=channel_name)
                     
-                    # Update latency if we have a UI callback for it
-                    if hasattr(self, 'ui_callbacks') and self.ui_callbacks and hasattr(self.ui_callbacks, 'update_latency'):
-                        self.ui_callbacks.update_latency(latency_ms)
+                    # Update latency if we have a UI callback for it and the value changed
+                    if self._last_latency_ms.get(guild_id) != latency_ms:
+                        self._last_latency_ms[guild_id] = latency_ms
+                        self._ui.update_latency(latency_ms)
                     
                     return True
         except Exception as e:
             self.debug_print(f"Error refreshing connection status: {e}")
             
+        # No active connection: resend latency once we are connected again
+        self._last_latency_ms.clear()
         return False
         
     async def setup_hook(self):
@@ -333,148 +398,310 @@ class DiscordBot(commands.Bot):
         try:
             self.debug_print("Running setup_hook...")
             
-            # Start connection manager
-            self._connection_manager_task = self.loop.create_task(self._connection_manager())
+            # Start connection workers; capped low since Discord rate-limits voice state updates
+            workers = max(1, min(int(self.config.get('connect_workers', 4)), MAX_CONNECT_WORKERS))
+            self._connection_workers = [self._start_connection_worker() for _ in range(workers)]
             
-            if not hasattr(self, '_scheduled_announcement_task_started'):
-                self.scheduled_announcement.start()
-                self._scheduled_announcement_task_started = True
+            # Start the announcement scheduler
+            self._restart_announcement_scheduler()
                 
             # Start status refresh task
             self._status_refresh_task = self.loop.create_task(self._periodic_status_refresh())
                 
             # Power on sequence for LED
-            if self.config.get('led_enabled', False):
-                power_on = self.config.get('led_colors', {}).get('power_on', {'red': 0, 'green': 100, 'blue': 0})
-                self.led_controller.set_color(0, 0, 
-                                           power_on['red'], 
-                                           power_on['green'], 
-                                           power_on['blue'])
+            if self._led_enabled:
+                await self.loop.run_in_executor(self._io_pool, functools.partial(
+                    self.led_controller.set_color, 0, 0, *self.led_cfg.power_on))
                 await asyncio.sleep(1)
-                self.led_controller.turn_off()
+                await self.loop.run_in_executor(self._io_pool, self.led_controller.turn_off)
             
             for guild in self.guilds:
-                self.debug_print(f"Checking guild: {guild.name} (ID: {guild.id})")
-                
-                # Only print members in voice channels
-                for vc in guild.voice_channels:
-                    if vc.members:  # Only print if there are members
-                        members_in_vc = [f"{m.name}#{m.discriminator}" for m in vc.members]
-                        self.debug_print(f"Voice channel '{vc.name}' members: {members_in_vc}")
+                # Guild and member listings are debug-only, so skip building them otherwise
+                if self._debug_mode:
+                    self.debug_print(f"Checking guild: {guild.name} (ID: {guild.id})")
+                    
+                    # Only print members in occupied voice channels, found through the guild's
+                    # voice state map instead of walking every channel's member list
+                    occupied: Dict[int, List[int]] = {}
+                    for user_id, voice_state in guild._voice_states.items():
+                        if voice_state.channel:
+                            occupied.setdefault(voice_state.channel.id, []).append(user_id)
+                            
+                    for channel_id, user_ids in occupied.items():
+                        vc = guild.get_channel(channel_id)
+                        members_in_vc = [str(guild.get_member(user_id) or user_id) for user_id in user_ids]
+                        self.debug_print(f"Voice channel '{vc.name if vc else channel_id}' members: {members_in_vc}")
                 
                 await self._try_connect_to_target_user(guild)
                 
         except Exception as e:
             self.debug_print(f"Error in setup_hook: {e}")
         
+    def _track_task(self, coro) -> asyncio.Task:
+        """Start a background task and keep a reference to it until it finishes"""
+        task = self.loop.create_task(coro)
+        self.running_tasks.append(task)
+        task.add_done_callback(self._forget_task)
+        return task
+        
+    def _forget_task(self, task: asyncio.Task):
+        """Drop a finished background task"""
+        try:
+            self.running_tasks.remove(task)
+        except ValueError:
+            pass
+        
+    @property
+    def ui_callbacks(self):
+        """Object receiving UI updates (the status window)"""
+        return self._ui_callbacks
+        
+    @ui_callbacks.setter
+    def ui_callbacks(self, callbacks):
+        """Resolve which UI callbacks exist once, substituting no-ops for the missing ones"""
+        self._ui_callbacks = callbacks
+        ui = SimpleNamespace(**{name: getattr(callbacks, name, None) or _noop for name in UI_CALLBACK_NAMES})
+        # Connection state goes to update_connection_status, or on_connection_status as a fallback
+        if getattr(callbacks, 'update_connection_status', None):
+            ui.connection_status = lambda connected, detail='': ui.update_connection_status(connected)
+        else:
+            ui.connection_status = ui.on_connection_status
+        self._ui = ui
+        
+    @property
+    def openai_client(self):
+        """Async OpenAI client, created once and reused so its connection pool is kept"""
+        if self._openai_client is None:
+            self._openai_client = openai.AsyncOpenAI(api_key=self._openai_api_key)
+        return self._openai_client
+        
+    def _publish_ui_state(self, **state):
+        """Queue a UI state change; changes within 50 ms are merged into one round of callbacks"""
+        self._pending_ui_state.update(state)
+        if self._ui_flush_handle is not None:
+            self._ui_flush_handle.cancel()
+        self._ui_flush_handle = self.loop.call_later(0.05, self._flush_ui_state)
+        
+    def _flush_ui_state(self):
+        """Push the merged UI state to the status, channel and connection callbacks"""
+        state, self._pending_ui_state = self._pending_ui_state, {}
+        self._ui_flush_handle = None
+        try:
+            if 'status' in state and self.status_callback:
+                self.status_callback(state['status'])
+            if 'channel' in state and self.channel_callback:
+                self.channel_callback(state['channel'])
+            if 'connected' in state:
+                self._ui.connection_status(state['connected'], state.get('detail', ''))
+        except Exception as e:
+            self.debug_print(f"Error updating UI state: {e}")
+        
+    def notify_ui_ready(self):
+        """Called from the UI thread once it has applied the connected status"""
+        try:
+            self.loop.call_soon_threadsafe(self._ui_ready_event.set)
+        except Exception as e:
+            self.debug_print(f"Error notifying UI ready: {e}")
+        
+    def _request_connection(self, guild_id: int, channel_id: int, member: Optional[discord.Member] = None):
+        """Record the latest connection intent for a guild, superseding any pending one"""
+        self._pending_intent[guild_id] = (channel_id, member)
+        self._intent_event.set()
+        
+    def _reset_pending_connections(self) -> int:
+        """Drop all pending connection intents in one step; returns how many were dropped"""
+        dropped = len(self._pending_intent)
+        self._pending_intent.clear()
+        self._intent_event.clear()
+        return dropped
+        
+    async def _disconnect_and_wait(self, guild_id: int, voice_client, force: bool = False, timeout: float = 2.0):
+        """Disconnect a voice client and wait until Discord reports that we left the channel"""
+        if not voice_client.is_connected():
+            await voice_client.disconnect(force=force)
+            return
+            
+        disconnected = self._disconnected_events[guild_id] = asyncio.Event()
+        try:
+            await voice_client.disconnect(force=force)
+            await asyncio.wait_for(disconnected.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            self.debug_print(f"No disconnect confirmation for guild {guild_id} after {timeout}s, continuing")
+        finally:
+            if self._disconnected_events.get(guild_id) is disconnected:
+                del self._disconnected_events[guild_id]
+        
+    def _connection_lock_for(self, guild_id: int) -> asyncio.Lock:
+        """Get the lock serializing connection attempts for one guild"""
+        lock = self._connection_locks.get(guild_id)
+        if lock is None:
+            lock = self._connection_locks[guild_id] = asyncio.Lock()
+        return lock
+        
+    def _start_connection_worker(self) -> asyncio.Task:
+        """Start one connection worker, restarting it if it dies on an unexpected error"""
+        worker = self.loop.create_task(self._connection_manager())
+        worker.add_done_callback(self._on_connection_worker_done)
+        return worker
+        
+    def _on_connection_worker_done(self, worker: asyncio.Task):
+        """Report a crashed connection worker and replace it"""
+        if worker.cancelled() or worker.exception() is None:
+            return
+        exc = worker.exception()
+        logger.error("Connection worker crashed", exc_info=exc)
+        self.debug_print(f"Connection worker crashed: {exc!r}, restarting it")
+        if worker in self._connection_workers:
+            self._connection_workers[self._connection_workers.index(worker)] = self._start_connection_worker()
+        
     async def _connection_manager(self):
-        """Manage voice connections"""
+        """Connection worker: manage voice connections for pending intents"""
+        consecutive_errors = 0
         while True:
             try:
-                # Get next connection request
-                guild_id, channel_id, target_user = await self._connection_queue.get()
+                # Wait until there is at least one pending connection intent
+                await self._intent_event.wait()
                 
-                async with self._connection_lock:
-                    # Check if we already have a connection for this guild
-                    if guild_id in self._voice_clients:
-                        current_client = self._voice_clients[guild_id]
-                        if current_client and current_client.is_connected():
-                            if current_client.channel and current_client.channel.id == channel_id:
-                                # Already in the right channel, skip connection
-                                self.debug_print(f"Already connected to channel {channel_id} in guild {guild_id}")
-                                continue
-                            else:
-                                # Disconnect from current channel
-                                try:
-                                    self.debug_print(f"Disconnecting from current channel {current_client.channel.id} to connect to new channel {channel_id}")
-                                    await current_client.disconnect()
-                                    # Add a small delay after disconnecting
-                                    await asyncio.sleep(1)
-                                except Exception as e:
-                                    self.debug_print(f"Error disconnecting from current channel: {e}")
+                # Only the most recent intent per guild is ever processed. Popping is
+                # synchronous, so no two workers can take the same intent.
+                if not self._pending_intent:
+                    self._intent_event.clear()
+                    continue
+                guild_id, (channel_id, target_user) = self._pending_intent.popitem()
+                if not self._pending_intent:
+                    self._intent_event.clear()
                     
-                    # Ensure the guild still exists
-                    guild = self.get_guild(guild_id)
-                    if not guild:
-                        self.debug_print(f"Guild {guild_id} not found")
-                        continue
-                        
-                    # Ensure the channel still exists
-                    channel = guild.get_channel(channel_id)
-                    if not channel:
-                        self.debug_print(f"Channel {channel_id} not found in guild {guild.name}")
-                        continue
-                    
-                    # Double-check if we're already connected to this channel
-                    if (guild.voice_client and guild.voice_client.is_connected() and 
-                        guild.voice_client.channel and guild.voice_client.channel.id == channel_id):
-                        self.debug_print(f"Already connected to channel {channel_id} in guild {guild.name}")
-                        self._voice_clients[guild_id] = guild.voice_client
-                        self._current_channel_id = channel_id
-                        continue
-                        
-                    # Connect to new channel
-                    try:
-                        self.debug_print(f"Attempting to connect to channel {channel.name} ({channel_id}) in guild {guild.name}")
-                        
-                        # Try to connect with a timeout
-                        try:
-                            # Use a timeout to prevent hanging indefinitely if connection fails
-                            voice_client = await asyncio.wait_for(
-                                channel.connect(cls=voice_recv.VoiceRecvClient), 
-                                timeout=10.0
-                            )
-                            
-                            self.debug_print(f"Successfully connected to voice channel {channel.name}")
-                            self._voice_clients[guild_id] = voice_client
-                            self._current_channel_id = channel_id
-                            
-                            # Setup audio sink
-                            if not hasattr(voice_client, 'sink'):
-                                voice_client.sink = MySink(
-                                    self.tts_manager,
-                                    self.led_controller,
-                                    self.config,
-                                    self.debug_print
-                                )
-                                voice_client.listen(voice_client.sink)
-                            
-                            # Update UI with connection status
-                            if self.status_callback:
-                                self.status_callback("Connected to Discord")
-                            if self.channel_callback:
-                                # Use the channel name rather than ID for better user experience
-                                channel_name = channel.name if hasattr(channel, 'name') else f"Channel {channel_id}"
-                                self.channel_callback(f"{channel_name}")
-                                
-                            # Set connected flag in UI if available
-                            if hasattr(self, 'ui_callbacks') and self.ui_callbacks:
-                                if hasattr(self.ui_callbacks, 'update_connection_status'):
-                                    self.ui_callbacks.update_connection_status(True)
-                                elif hasattr(self.ui_callbacks, 'on_connection_status'):
-                                    self.ui_callbacks.on_connection_status(True, f"Connected to {channel.name}")
-                                    
-                            # Schedule a status update after 1 second to ensure UI reflects correct state
-                            self.loop.create_task(self._delayed_status_update(guild_id, channel_id))
-                            
-                        except asyncio.TimeoutError:
-                            self.debug_print(f"Connection to channel {channel_id} timed out")
-                            if guild_id in self._voice_clients:
-                                del self._voice_clients[guild_id]
-                            raise Exception("Connection timeout")
-                            
-                    except Exception as e:
-                        self.debug_print(f"Error connecting to channel {channel_id}: {e}")
-                        if guild_id in self._voice_clients:
-                            del self._voice_clients[guild_id]
-                        self._current_channel_id = None
-                        
+                # Intents for the same guild run one after another; other guilds connect concurrently
+                async with self._connection_lock_for(guild_id):
+                    await self._process_intent(guild_id, channel_id)
+                consecutive_errors = 0
+                
             except asyncio.CancelledError:
                 break
-            except Exception as e:
-                self.debug_print(f"Error in connection manager: {e}")
-                await asyncio.sleep(1)  # Prevent tight loop on errors
+            except (discord.DiscordException, asyncio.TimeoutError) as e:
+                # Back off exponentially on Discord/network errors to spare the rate limit;
+                # anything else is a bug and ends the worker so it gets reported
+                consecutive_errors += 1
+                delay = min(30, 0.1 * 2 ** consecutive_errors)
+                self.debug_print(f"Error in connection manager: {e}, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                
+    async def _process_intent(self, guild_id: int, channel_id: int):
+        """Bring one guild's voice connection to the requested channel"""
+        # Check if we already have a connection for this guild
+        if guild_id in self._voice_clients:
+            current_client = self._voice_clients[guild_id]
+            if current_client and current_client.is_connected():
+                if current_client.channel and current_client.channel.id == channel_id:
+                    # Already in the right channel, skip connection
+                    self.debug_print(f"Already connected to channel {channel_id} in guild {guild_id}")
+                    return
+                else:
+                    # Disconnect from current channel
+                    try:
+                        self.debug_print(f"Disconnecting from current channel {current_client.channel.id} to connect to new channel {channel_id}")
+                        await self._disconnect_and_wait(guild_id, current_client)
+                    except Exception as e:
+                        self.debug_print(f"Error disconnecting from current channel: {e}")
+        
+        # Ensure the guild still exists
+        guild = self.get_guild(guild_id)
+        if not guild:
+            self.debug_print(f"Guild {guild_id} not found")
+            return
+            
+        # Ensure the channel still exists
+        channel = self._get_channel(guild, channel_id)
+        if not channel:
+            self.debug_print(f"Channel {channel_id} not found in guild {guild.name}")
+            return
+        
+        # Double-check if we're already connected to this channel
+        if (guild.voice_client and guild.voice_client.is_connected() and 
+            guild.voice_client.channel and guild.voice_client.channel.id == channel_id):
+            self.debug_print(f"Already connected to channel {channel_id} in guild {guild.name}")
+            self._voice_clients[guild_id] = guild.voice_client
+            self._current_channel_id = channel_id
+            return
+            
+        # Connect to new channel
+        self.debug_print(f"Attempting to connect to channel {channel.name} ({channel_id}) in guild {guild.name}")
+        await self._perform_connect(guild, channel)
+
+    async def _perform_connect(self, guild: discord.Guild, channel) -> Optional[voice_recv.VoiceRecvClient]:
+        """Connect to a voice channel, install the audio sink and update the UI; returns None on failure"""
+        guild_id = guild.id
+        channel_id = channel.id
+        try:
+            # Use a timeout to prevent hanging indefinitely if connection fails
+            voice_client = await asyncio.wait_for(
+                channel.connect(cls=voice_recv.VoiceRecvClient), 
+                timeout=10.0
+            )
+            
+            self.debug_print(f"Successfully connected to voice channel {channel.name}")
+            self._voice_clients[guild_id] = voice_client
+            self._current_channel_id = channel_id
+            self._register_latency_getter(guild_id, voice_client)
+            
+            # Setup audio sink
+            if getattr(voice_client, 'sink', None) is None:
+                voice_client.sink = MySink(
+                    self.tts_manager,
+                    self.led_controller,
+                    self.config,
+                    self.debug_print
+                )
+                voice_client.listen(voice_client.sink)
+            
+            # Update UI with connection status; use the channel name rather than ID for better user experience
+            channel_name = channel.name if hasattr(channel, 'name') else f"Channel {channel_id}"
+            self._publish_ui_state(status="Connected to Discord", channel=channel_name,
+                                   connected=True, detail=f"Connected to {channel_name}")
+                    
+            # Schedule a status update once the connection is ready to ensure UI reflects correct state
+            self._track_task(self._delayed_status_update(guild_id, channel_id))
+            return voice_client
+            
+        except asyncio.TimeoutError:
+            self.debug_print(f"Connection to channel {channel.name} ({channel_id}) timed out")
+        except Exception as e:
+            self.debug_print(f"Error connecting to channel {channel_id}: {e}")
+            
+        self._voice_clients.pop(guild_id, None)
+        self._current_channel_id = None
+        return None
 
+    def _audio_player_for(self, voice_client) -> AudioPlayer:
+        """Get the audio player for a voice client, creating it on first use"""
+        guild_id = voice_client.guild.id
+        entry = self._audio_players.get(guild_id)
+        if entry is None or entry[0] is not voice_client:
+            entry = self._audio_players[guild_id] = (voice_client, AudioPlayer(voice_client, self.tts_manager, self.debug_print))
+        return entry[1]
+        
+    def _latency_ms(self, guild_id: int, voice_client) -> int:
+        """Voice latency in milliseconds; NaN, infinity and errors map to 0"""
+        try:
+            getter = self._latency_getters.get(guild_id)
+            if getter is None:
+                getter = self._register_latency_getter(guild_id, voice_client)
+            latency = getter()
+            if latency == latency and latency != INF:
+                return int(latency * 1000)
+        except Exception as e:
+            self.debug_print(f"Error getting latency: {e}")
+        return 0
+        
+    def _register_latency_getter(self, guild_id: int, voice_client) -> Callable[[], float]:
+        """Resolve once whether latency is a method or a property and store a plain accessor"""
+        if callable(getattr(type(voice_client), 'latency', None)):
+            getter = voice_client.latency
+        else:
+            getter = lambda vc=voice_client: vc.latency
+        self._latency_getters[guild_id] = getter
+        return getter
+        
     async def _try_connect_to_channel(self, channel_id: int) -> bool:
         """Try to connect to a specific voice channel"""
         try:
@@ -483,84 +710,170 @@ class DiscordBot(commands.Bot):
                 self.debug_print(f"Could not find channel with ID {channel_id}")
                 return False
                 
-            # Add connection request to queue
-            await self._connection_queue.put((channel.guild.id, channel_id, None))
+            # Record connection request
+            self._request_connection(channel.guild.id, channel_id)
             return True
             
         except Exception as e:
             self.debug_print(f"Error in _try_connect_to_channel: {e}")
             return False
 
+    def _voice_ready_for(self, guild_id: int) -> asyncio.Event:
+        """Event set while the bot is in a voice channel of the guild"""
+        voice_ready = self._voice_ready.get(guild_id)
+        if voice_ready is None:
+            voice_ready = self._voice_ready[guild_id] = asyncio.Event()
+        return voice_ready
+        
+    def _get_channel(self, guild: discord.Guild, channel_id: int):
+        """Look up a guild channel, remembering it for later intents"""
+        key = (guild.id, channel_id)
+        channel = self._channel_cache.get(key)
+        if channel is None:
+            channel = guild.get_channel(channel_id)
+            if channel is not None:
+                self._channel_cache[key] = channel
+        return channel
+        
+    @staticmethod
+    def _member_keys(member) -> set:
+        """Lookup keys for a member: lowercased name and name#discriminator"""
+        return {member.name.lower(), str(member).lower()}
+        
+    def _get_member_index(self, guild: discord.Guild) -> Dict[str, discord.Member]:
+        """Return the name index for a guild, building it from the member cache on first use"""
+        index = self._member_index.get(guild.id)
+        if index is None:
+            index = {}
+            for member in guild.members:
+                for key in self._member_keys(member):
+                    index.setdefault(key, member)
+            self._member_index[guild.id] = index
+            target = index.get(self._target_lower)
+            if target is not None:
+                self._target_user_id = target.id
+        return index
+        
+    def _index_member(self, member: discord.Member):
+        """Add a member to its guild's name index, if that index has been built"""
+        index = self._member_index.get(member.guild.id)
+        if index is not None:
+            for key in self._member_keys(member):
+                index[key] = member
+                if key == self._target_lower:
+                    self._target_user_id = member.id
+                
+    def _unindex_member(self, member, guild_id: int):
+        """Remove a member's names from a guild's name index"""
+        if member.id == self._target_user_id:
+            # Name may have changed; re-resolve by name on the next event
+            self._target_user_id = None
+        index = self._member_index.get(guild_id)
+        if index is not None:
+            for key in self._member_keys(member):
+                if getattr(index.get(key), 'id', None) == member.id:
+                    del index[key]
+                    
+    def reload_config(self):
+        """Re-read the settings bound as attributes from the shared config"""
+        target_user = self.config.get('target_user', '')
+        if target_user.lower() != getattr(self, '_target_lower', None):
+            # Different target: drop the resolved id so it is looked up again
+            self._target_user_id = None
+        self._target_user = target_user
+        self._target_lower = target_user.lower()
+        self._debug_mode = bool(self.config.get('debug_mode', False))
+        self.led_cfg = LEDConfig.from_config(self.config)
+        self._led_enabled = self.led_cfg.enabled
+        # Chat model name (default to GPT-3.5-turbo), without any pricing info shown in the UI
+        self._gpt_model = self.config.get('gpt_model', 'gpt-3.5-turbo').split("(")[0].strip()
+        openai_api_key = self.config.get('openai_api_key', '')
+        if openai_api_key != getattr(self, '_openai_api_key', None):
+            # New API key: build a new client on the next chat message
+            self._openai_client = None
+        self._openai_api_key = openai_api_key
+        
+        # Announcement settings as (enabled, day, hour, minute); None if the schedule is invalid
+        announcement_cfg = getattr(self, '_announcement_cfg', None)
+        try:
+            self._announcement_cfg = (bool(self.config.get('announcement_enabled', True)),
+                                      int(self.config.get('announcement_day', 4)),  # Default to Friday (4)
+                                      int(self.config.get('announcement_hour', 19)),
+                                      int(self.config.get('announcement_minute', 0)))
+        except (TypeError, ValueError) as e:
+            self.debug_print(f"Invalid announcement schedule in config: {e}")
+            self._announcement_cfg = None
+            
+        # Audio sinks keep their own copy of the LED settings
+        for voice_client in list(self._voice_clients.values()):
+            sink = getattr(voice_client, 'sink', None)
+            if isinstance(sink, MySink):
+                sink.reload_config(self.led_cfg)
+                
+        # A running scheduler sleeps toward the old time, so restart it on the bot's loop
+        if self._announcement_task is not None and self._announcement_cfg != announcement_cfg:
+            self.loop.call_soon_threadsafe(self._restart_announcement_scheduler)
+        
+    def set_target_user(self, target_user: str):
+        """Change the target user"""
+        self.config['target_user'] = target_user
+        self.reload_config()
+        
     async def _try_connect_to_target_user(self, guild: discord.Guild) -> bool:
         """Try to connect to the target user's voice channel"""
-        target_user = self.config.get('target_user', '')
+        target_user = self._target_user
         
         self.debug_print(f"Looking for target user '{target_user}' in guild '{guild.name}'")
         self.debug_print(f"Guild has {len(guild.members)} cached members")
         
-        found_user = False
-        
-        for member in guild.members:
-            # Check both name and name#discriminator, case insensitive
-            member_full = str(member).lower()
-            target_lower = target_user.lower()
+        # Check both name and name#discriminator, case insensitive
+        member = self._get_member_index(guild).get(self._target_lower)
+        if not member:
+            self.debug_print(f"Could not find {target_user} in guild {guild.name}")
+            return False
             
-            if member_full == target_lower or member.name.lower() == target_lower:
-                found_user = True
-                self.debug_print(f"Found target user: {member}")
-                if member.voice and member.voice.channel:
-                    # Add connection request to queue
-                    channel_id = member.voice.channel.id
-                    channel_name = member.voice.channel.name
-                    self.debug_print(f"Target user is in voice channel: {channel_name} ({channel_id})")
-                    
-                    # Clear any existing connection to this guild first
-                    if guild.id in self._voice_clients:
-                        try:
-                            existing_client = self._voice_clients[guild.id]
-                            if existing_client and existing_client.is_connected():
-                                self.debug_print(f"Disconnecting from existing voice connection in {guild.name}")
-                                await existing_client.disconnect()
-                        except Exception as e:
-                            self.debug_print(f"Error disconnecting from existing connection: {e}")
-                    
-                    await self._connection_queue.put((guild.id, channel_id, member))
-                    return True
-                else:
-                    self.debug_print(f"{target_user} was found in guild {guild.name} but is not in a voice channel")
+        self.debug_print(f"Found target user: {member}")
+        if not (member.voice and member.voice.channel):
+            self.debug_print(f"{target_user} was found in guild {guild.name} but is not in a voice channel")
+            return False
+            
+        # Add connection request to queue
+        channel_id = member.voice.channel.id
+        channel_name = member.voice.channel.name
+        self.debug_print(f"Target user is in voice channel: {channel_name} ({channel_id})")
         
-        if not found_user:
-            self.debug_print(f"Could not find {target_user} in guild {guild.name}")
+        # Clear any existing connection to this guild first
+        if guild.id in self._voice_clients:
+            try:
+                existing_client = self._voice_clients[guild.id]
+                if existing_client and existing_client.is_connected():
+                    self.debug_print(f"Disconnecting from existing voice connection in {guild.name}")
+                    await existing_client.disconnect()
+            except Exception as e:
+                self.debug_print(f"Error disconnecting from existing connection: {e}")
         
-        return False
+        self._request_connection(guild.id, channel_id, member)
+        return True
 
     async def disconnect_voice(self):
         """Disconnect from all voice channels"""
         self.debug_print("Disconnecting from all voice channels")
         
-        # Update UI status immediately
-        if self.status_callback:
-            self.status_callback("Disconnecting...")
-        if self.channel_callback:
-            self.channel_callback("Not connected")
+        # Update UI status right away, superseding any pending connected state; connected/detail
+        # are overwritten too so a queued connected=True can't flush after the disconnect
+        self._publish_ui_state(status="Disconnecting...", channel="Not connected",
+                               connected=False, detail="Disconnected")
             
-        # Reset latency and connection status in UI if available
-        if hasattr(self, 'ui_callbacks') and self.ui_callbacks:
-            if hasattr(self.ui_callbacks, 'update_latency'):
-                self.ui_callbacks.update_latency(0)
-                self.debug_print("Reset latency display to 0")
-            if hasattr(self.ui_callbacks, 'update_connection_status'):
-                self.ui_callbacks.update_connection_status(False)
-                self.debug_print("Set connection status to disconnected")
-            if hasattr(self.ui_callbacks, 'update_voice_connection'):
-                self.ui_callbacks.update_voice_connection("Disconnected", False)
-                self.debug_print("Set voice connection to disconnected")
-            if hasattr(self.ui_callbacks, 'on_connection_status'):
-                self.ui_callbacks.on_connection_status(False, "Disconnected")
-                self.debug_print("Updated connection status to disconnected")
+        # Reset latency and connection status in UI (missing callbacks are no-ops)
+        self._last_latency_ms.clear()
+        self._ui.update_latency(0)
+        self._ui.update_connection_status(False)
+        self._ui.update_voice_connection("Disconnected", False)
+        self._ui.on_connection_status(False, "Disconnected")
             
         try:
             # First, check for any voice clients in guilds
+            disconnects = {}
             for guild in self.guilds:
                 if guild.voice_client:
                     try:
@@ -577,15 +890,16 @@ class DiscordBot(commands.Bot):
                                 
                             # Use force disconnect as a last resort
                             if hasattr(voice_client, 'disconnect'):
-                                try:
-                                    await voice_client.disconnect(force=True)
-                                except Exception as e:
-                                    self.debug_print(f"Error during voice_client.disconnect: {e}")
+                                disconnects[guild.id] = self._with_connection_lock(
+                                    guild.id, self._disconnect_and_wait(guild.id, voice_client, force=True))
                     except Exception as e:
                         self.debug_print(f"Error disconnecting from guild {guild.name}: {e}")
             
-            # Add a delay to let Discord process disconnects
-            await asyncio.sleep(1.0)
+            # Disconnect all guilds at once and wait until Discord confirms each one
+            results = await asyncio.gather(*disconnects.values(), return_exceptions=True)
+            for guild_id, result in zip(disconnects, results):
+                if isinstance(result, Exception):
+                    self.debug_print(f"Error during voice_client.disconnect in guild {guild_id}: {result}")
                     
             # Now check our tracking dictionary and clean up any remaining clients
             for guild_id, voice_client in list(self._voice_clients.items()):
@@ -607,8 +921,7 @@ class DiscordBot(commands.Bot):
             self._current_channel_id = None
             
             # Update UI status again
-            if self.status_callback:
-                self.status_callback("Disconnected")
+            self._publish_ui_state(status="Disconnected")
                 
             return True
         except Exception as e:
@@ -619,38 +932,20 @@ class DiscordBot(commands.Bot):
         """Disconnect and reconnect to voice channels to fix audio issues"""
         self.debug_print("Reconnect requested - disconnecting from all voice channels")
         
-        # Store current connected channels before disconnecting
+        # In one pass, store current connected channels and collect every guild with a voice client
         target_channels = []
-        for guild in self.guilds:
-            if guild.voice_client and guild.voice_client.is_connected():
-                channel = guild.voice_client.channel
-                target_user = self._find_target_user_in_guild(guild)
-                target_channels.append((guild, channel.id, channel.name, target_user))
-                self.debug_print(f"Saving current connection: {channel.name} in {guild.name}")
-        
-        # Disconnect from all channels
-        for guild in self.guilds:
-            if guild.voice_client and guild.voice_client.is_connected():
-                try:
-                    await guild.voice_client.disconnect(force=True)
-                    self.debug_print(f"Disconnected from voice in {guild.name}")
-                except Exception as e:
-                    self.debug_print(f"Error disconnecting from {guild.name}: {e}")
-        
-        # Delay to let Discord register the disconnect
-        await asyncio.sleep(2.0)
-        
-        # Manually clear any lingering connections at the Discord.py level
+        voice_guilds = []
         for guild in self.guilds:
             if guild.voice_client:
-                try:
-                    guild.voice_client.cleanup()
-                    self.debug_print(f"Cleaned up voice client for {guild.name}")
-                except Exception as e:
-                    self.debug_print(f"Error cleaning up voice client: {e}")
+                voice_guilds.append(guild)
+                if guild.voice_client.is_connected():
+                    channel = guild.voice_client.channel
+                    target_user = self._find_target_user_in_guild(guild)
+                    target_channels.append((guild, channel.id, channel.name, target_user))
+                    self.debug_print(f"Saving current connection: {channel.name} in {guild.name}")
         
-        # Wait a bit more
-        await asyncio.sleep(1.0)
+        # Disconnect and clean up all guilds concurrently
+        await asyncio.gather(*(self._disconnect_and_cleanup(guild) for guild in voice_guilds))
         
         # Try to reconnect to the saved channels first
         if target_channels:
@@ -677,12 +972,36 @@ class DiscordBot(commands.Bot):
         self.debug_print("Reconnect process completed")
         
         # Update UI
-        if self.ui_callbacks and hasattr(self.ui_callbacks, 'on_reconnect_completed'):
-            self.ui_callbacks.on_reconnect_completed()
+        self._ui.on_reconnect_completed()
+        
+    async def _with_connection_lock(self, guild_id: int, coro):
+        """Run a coroutine while holding the guild's connection lock"""
+        async with self._connection_lock_for(guild_id):
+            return await coro
+            
+    async def _disconnect_and_cleanup(self, guild: discord.Guild):
+        """Disconnect a guild's voice client, wait for Discord to register it and clear any leftovers"""
+        # Serialize with the connection workers and other connects/disconnects for this guild
+        async with self._connection_lock_for(guild.id):
+            voice_client = guild.voice_client
+            if voice_client and voice_client.is_connected():
+                try:
+                    await self._disconnect_and_wait(guild.id, voice_client, force=True)
+                    self.debug_print(f"Disconnected from voice in {guild.name}")
+                except Exception as e:
+                    self.debug_print(f"Error disconnecting from {guild.name}: {e}")
+                    
+            # Manually clear any lingering connection at the Discord.py level
+            if guild.voice_client:
+                try:
+                    guild.voice_client.cleanup()
+                    self.debug_print(f"Cleaned up voice client for {guild.name}")
+                except Exception as e:
+                    self.debug_print(f"Error cleaning up voice client: {e}")
         
     async def _find_and_connect_to_target_user(self):
         """Find and connect to target user across all guilds"""
-        target_user = self.config.get('target_user', '')
+        target_user = self._target_user
         if not target_user:
             self.debug_print("No target user configured")
             return False
@@ -690,12 +1009,14 @@ class DiscordBot(commands.Bot):
         self.debug_print(f"Searching for {target_user} across all guilds")
         connected = False
         
+        # _try_connect_to_target_user only records a connection intent, so stop at the first
+        # guild where the target is found; that keeps intents from piling up in several guilds
         for guild in self.guilds:
             try:
                 self.debug_print(f"Searching in guild {guild.name}")
                 if await self._try_connect_to_target_user(guild):
-                    connected = True
                     self.debug_print(f"Successfully connected in guild {guild.name}")
+                    connected = True
                     break
             except Exception as e:
                 self.debug_print(f"Error connecting in guild {guild.name}: {e}")
@@ -704,44 +1025,69 @@ class DiscordBot(commands.Bot):
     
     def _find_target_user_in_guild(self, guild):
         """Find the target user in a specific guild"""
-        target_user = self.config.get('target_user', '')
-        if not target_user:
+        if not self._target_user:
             return None
         
-        for member in guild.members:
-            member_full = str(member).lower()
-            target_lower = target_user.lower()
-            
-            if member_full == target_lower or member.name.lower() == target_lower:
-                return member
-            
-        return None
+        # Check both name and name#discriminator, case insensitive
+        return self._get_member_index(guild).get(self._target_lower)
 
-    @tasks.loop(minutes=1)  # Check every minute
-    async def scheduled_announcement(self):
-        """Handle scheduled announcements"""
-        current_time = datetime.datetime.now()
-        
-        # Get announcement settings from config
-        enabled = self.config.get('announcement_enabled', True)
-        target_day = self.config.get('announcement_day', 4)  # Default to Friday (4)
-        target_hour = self.config.get('announcement_hour', 19)
-        target_minute = self.config.get('announcement_minute', 0)
-        
-        self.debug_print(f"Checking scheduled announcement at {current_time}")
-        self.debug_print(f"Current day: {current_time.weekday()}, hour: {current_time.hour}, minute: {current_time.minute}")
-        self.debug_print(f"Target day: {target_day}, hour: {target_hour}, minute: {target_minute}")
-        
-        # Check if announcement is enabled and it's the right time
-        if (enabled and 
-            current_time.weekday() == target_day and 
-            current_time.hour == target_hour and 
-            current_time.minute == target_minute):
-            
-            await self._do_announcement()
+    def _restart_announcement_scheduler(self):
+        """(Re)start the announcement scheduler with the current settings"""
+        if self._announcement_task is not None:
+            self._announcement_task.cancel()
+        self._announcement_task = self.loop.create_task(self._announcement_scheduler())
+        
+    async def _announcement_scheduler(self):
+        """Sleep until each weekly announcement and play it"""
+        try:
+            while True:
+                # Announcement settings are bound by reload_config(), which restarts us on change
+                if self._announcement_cfg is None or not self._announcement_cfg[0]:
+                    return
+                schedule = self._announcement_cfg[1:]
+                delay = self._seconds_until_announcement(*schedule)
+                self.debug_print(f"Next announcement in {delay / 3600:.1f} hours "
+                                 f"(day: {schedule[0]}, hour: {schedule[1]}, minute: {schedule[2]})")
+                await asyncio.sleep(delay)
+                try:
+                    await self._do_announcement()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    # A missed week (e.g. nobody in voice) must not stop the following ones
+                    self.debug_print(f"Error playing scheduled announcement: {e}")
+                # Step past the target minute so the next computation lands a week later
+                await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            # Only reached for a schedule that can't be computed (e.g. hour out of range)
+            self.debug_print(f"Error in announcement scheduler: {e}")
+        
+    @staticmethod
+    def _seconds_until_announcement(day: int, hour: int, minute: int) -> float:
+        """Seconds from now until the next weekly announcement (0 if we are inside the target minute)"""
+        now = datetime.datetime.now()
+        target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        target += datetime.timedelta(days=(day - now.weekday()) % 7)
+        if target + datetime.timedelta(minutes=1) <= now:
+            target += datetime.timedelta(days=7)
+        return max(0.0, (target - now).total_seconds())
             
     async def _do_announcement(self, ctx=None):
         """Internal method to handle the announcement playback"""
+        # Drop overlapping triggers (scheduler, !testfriday, UI) rather than racing voice_client.play
+        if self._announcement_lock.locked():
+            self.debug_print("Announcement already playing, skipping duplicate request")
+            if ctx:
+                await ctx.send("An announcement is already playing!")
+            return
+            
+        async with self._announcement_lock:
+            await self._play_announcement(ctx)
+            
+    async def _play_announcement(self, ctx=None):
+        """Find a voice client and play the announcement"""
         try:
             self.debug_print("Starting announcement playback")
             voice_client = None
@@ -749,22 +1095,30 @@ class DiscordBot(commands.Bot):
             # If ctx is None (called from scheduler), find a suitable voice channel
             if ctx is None:
                 self.debug_print("Called from scheduler/test - looking for voice channel")
-                for guild in self.guilds:
+                # Use a tracked connection if we have one
+                for guild_id, tracked_client in self._voice_clients.items():
+                    if tracked_client and tracked_client.is_connected():
+                        voice_client = tracked_client
+                        self.debug_print(f"Using tracked voice client in guild {guild_id}")
+                        break
+                        
+                # Otherwise scan the guilds
+                for guild in (self.guilds if voice_client is None else ()):
                     voice_client = guild.voice_client
                     if voice_client and voice_client.is_connected():
                         self.debug_print(f"Found connected voice client in guild {guild.name}")
                         break
                     
-                    # If not connected, try to connect to a channel where the bot is present
-                    for vc in guild.voice_channels:
-                        if self.user in vc.members:
-                            self.debug_print(f"Found bot in channel {vc.name}, attempting to connect")
-                            try:
-                                voice_client = await vc.connect()
-                                self.debug_print("Successfully connected to voice channel")
-                                break
-                            except Exception as e:
-                                self.debug_print(f"Failed to connect to voice channel: {e}")
+                    # If not connected, try to connect to the channel our voice state says the bot is in
+                    me = guild.me
+                    vc = me.voice.channel if me and me.voice else None
+                    if vc is not None:
+                        self.debug_print(f"Found bot in channel {vc.name}, attempting to connect")
+                        try:
+                            voice_client = await vc.connect()
+                            self.debug_print("Successfully connected to voice channel")
+                        except Exception as e:
+                            self.debug_print(f"Failed to connect to voice channel: {e}")
                     if voice_client and voice_client.is_connected():
                         break
             else:
@@ -781,8 +1135,8 @@ class DiscordBot(commands.Bot):
                     voice_client = ctx.voice_client
             
             if voice_client and voice_client.is_connected():
-                # Create audio player for announcement
-                audio_player = AudioPlayer(voice_client, self.tts_manager, self.debug_print)
+                # Get audio player for announcement
+                audio_player = self._audio_player_for(voice_client)
                 
                 # Play announcement
                 announcement_text = "Happy Friday everyone! It's time for the weekend!"
@@ -812,58 +1166,26 @@ class DiscordBot(commands.Bot):
     async def cleanup(self):
         """Clean up resources"""
         try:
-            # Cancel connection manager
-            if hasattr(self, '_connection_manager_task') and self._connection_manager_task:
-                self._connection_manager_task.cancel()
-                try:
-                    await self._connection_manager_task
-                except asyncio.CancelledError:
-                    pass
-                    
-            # Cancel status refresh task
-            if hasattr(self, '_status_refresh_task') and self._status_refresh_task:
-                self._status_refresh_task.cancel()
-                try:
-                    await self._status_refresh_task
-                except asyncio.CancelledError:
-                    pass
+            # Cancel connection workers, the announcement scheduler, the status refresh task
+            # and any running tasks together, then wait for all of them at once
+            background = [*self._connection_workers, *self.running_tasks,
+                          *(task for task in (self._announcement_task, self._status_refresh_task) if task)]
+            for task in background:
+                task.cancel()
+            for result in await asyncio.gather(*background, return_exceptions=True):
+                if isinstance(result, Exception):
+                    self.debug_print(f"Error canceling task: {result}")
                     
             # Clean up voice clients
-            for guild_id, voice_client in list(self._voice_clients.items()):
-                try:
-                    if voice_client and voice_client.is_connected():
-                        # Clear voice state handlers first to prevent callbacks during disconnect
-                        if hasattr(voice_client, '_voice_state_update_handler'):
-                            voice_client._voice_state_update_handler = None
-                        await voice_client.disconnect()
-                except Exception as e:
-                    self.debug_print(f"Error disconnecting voice client {guild_id}: {e}")
-                finally:
-                    del self._voice_clients[guild_id]
+            await self._disconnect_tracked_clients()
                     
-            # Clear connection queue
-            while not self._connection_queue.empty():
-                try:
-                    self._connection_queue.get_nowait()
-                except asyncio.QueueEmpty:
-                    break
-                    
-            # Cancel any running tasks
-            for task in self.running_tasks:
-                try:
-                    if not task.done():
-                        task.cancel()
-                        try:
-                            await task
-                        except asyncio.CancelledError:
-                            pass
-                except Exception as e:
-                    self.debug_print(f"Error canceling task: {e}")
+            # Clear pending connection requests
+            self._reset_pending_connections()
                     
             # Clean up LED controller
             if self.led_controller:
                 try:
-                    await self.led_controller.cleanup()
+                    await self.led_controller.cleanup(self._io_pool)
                 except Exception as e:
                     self.debug_print(f"Error cleaning up LED controller: {e}")
                     
@@ -882,18 +1204,47 @@ class DiscordBot(commands.Bot):
         finally:
             # Clear all references
             self._voice_clients.clear()
+            self._latency_getters.clear()
+            self._audio_players.clear()
+            self._channel_cache.clear()
+            self._voice_ready.clear()
+            if self._ui_flush_handle is not None:
+                self._ui_flush_handle.cancel()
+                self._ui_flush_handle = None
+            self._pending_ui_state.clear()
             self._current_channel_id = None
             self._connection_tasks.clear()
             self.running_tasks.clear()
+            self._tts_task = None
             self.scheduled_announcements.clear()
             
             # Clear event loop reference
             if hasattr(self, '_loop'):
                 self._loop = None
                 
-            # Clear connection manager task
-            self._connection_manager_task = None
+            # Clear connection workers
+            self._connection_workers.clear()
+            self._connection_locks.clear()
+            
+            # Stop accepting blocking I/O work; don't wait for in-flight USB writes
+            self._io_pool.shutdown(wait=False)
 
+    async def _disconnect_tracked_clients(self):
+        """Disconnect every tracked voice client at once and stop tracking them"""
+        clients = {guild_id: voice_client for guild_id, voice_client in self._voice_clients.items()
+                   if voice_client and voice_client.is_connected()}
+        for voice_client in clients.values():
+            # Clear voice state handlers first to prevent callbacks during disconnect
+            if hasattr(voice_client, '_voice_state_update_handler'):
+                voice_client._voice_state_update_handler = None
+                
+        results = await asyncio.gather(*(voice_client.disconnect() for voice_client in clients.values()),
+                                       return_exceptions=True)
+        for guild_id, result in zip(clients, results):
+            if isinstance(result, Exception):
+                self.debug_print(f"Error disconnecting voice client {guild_id}: {result}")
+        self._voice_clients.clear()
+        
     async def _periodic_status_refresh(self):
         """Periodically refresh UI status to ensure it stays in sync with actual connection state"""
         try:
@@ -904,35 +1255,28 @@ class DiscordBot(commands.Bot):
             while True:
                 try:
                     # Skip full status refresh if debug mode is disabled
-                    if self.config.get('debug_mode', False):
+                    if self._debug_mode:
                         # Full refresh with logging
                         await self._refresh_connection_status()
                     else:
-                        # Only update status UI without logging
-                        for guild_id, voice_client in list(self._voice_clients.items()):
-                            if voice_client and voice_client.is_connected() and voice_client.channel:
-                                # Update the UI with minimal logging
-                                if self.status_callback:
-                                    self.status_callback("Connected to Discord")
-                                if self.channel_callback:
-                                    channel_name = voice_client.channel.name if hasattr(voice_client.channel, 'name') else f"Channel {voice_client.channel.id}"
-                                    self.channel_callback(f"{channel_name}")
-                                    
-                                # Update latency without logging
-                                latency_ms = 0
-                                try:
-                                    if hasattr(voice_client, 'latency'):
-                                        if isinstance(voice_client.latency, float) and not math.isinf(voice_client.latency) and not math.isnan(voice_client.latency):
-                                            latency_ms = int(voice_client.latency * 1000)
-                                except:
-                                    pass
-                                    
-                                if hasattr(self, 'ui_callbacks') and self.ui_callbacks and hasattr(self.ui_callbacks, 'update_latency'):
-                                    self.ui_callbacks.update_latency(latency_ms)
+                        # Only update status UI without logging, and only the parts that changed
+                        for guild_id, voice_client in self._voice_clients.items():
+                            if voice_client and voice_client.channel:
+                                channel_name = voice_client.channel.name if hasattr(voice_client.channel, 'name') else f"Channel {voice_client.channel.id}"
+                                state = ("Connected to Discord", channel_name, self._latency_ms(guild_id, voice_client))
+                                last_status, last_channel, last_latency = self._last_ui_state
+                                if state[:2] != (last_status, last_channel):
+                                    self._publish_ui_state(status=state[0], channel=state[1])
+                                if state[2] != last_latency:
+                                    self._ui.update_latency(state[2])
+                                self._last_ui_state = state
                                 break
+                        else:
+                            # Not connected; report everything again after the next connect
+                            self._last_ui_state = (None, None, None)
                     
-                    # Wait before next refresh (10 seconds)
-                    await asyncio.sleep(10)
+                    # Wait before next refresh (10 seconds, 30 while there is nothing to report)
+                    await asyncio.sleep(10 if self._voice_clients else 30)
                 except asyncio.CancelledError:
                     # Task was cancelled, exit the loop
                     break
@@ -953,6 +1297,7 @@ class DiscordBot(commands.Bot):
             await self._refresh_guild_state()
             
             connected = False
+            target_lower = self._target_lower
             for guild in self.guilds:
                 # Check if the guild has an active voice client
                 if guild.voice_client and guild.voice_client.is_connected():
@@ -964,23 +1309,20 @@ class DiscordBot(commands.Bot):
                     self._current_channel_id = guild.voice_client.channel.id
                     
                     # Update UI status
-                    if self.status_callback:
-                        self.status_callback("Connected to Discord")
-                    if self.channel_callback:
-                        channel_name = guild.voice_client.channel.name
-                        self.channel_callback(f"{channel_name}")
+                    self._publish_ui_state(status="Connected to Discord",
+                                           channel=guild.voice_client.channel.name)
                 
-                # Check which members are in voice channels
-                for vc in guild.voice_channels:
-                    if vc.members:
-                        member_names = [f"{m.name}" for m in vc.members]
-                        self.debug_print(f"Voice channel '{vc.name}' in guild '{guild.name}' has members: {', '.join(member_names)}")
+                # Check which members are in voice channels (only listed in debug mode)
+                if self._debug_mode:
+                    for vc in guild.voice_channels:
+                        if vc.members:
+                            member_names = ', '.join(m.name for m in vc.members)
+                            self.debug_print(f"Voice channel '{vc.name}' in guild '{guild.name}' has members: {member_names}")
                         
-                        # Check if target user is in this channel
-                        target_user = self.config.get('target_user', '').lower()
-                        for member in vc.members:
-                            if member.name.lower() == target_user or str(member).lower() == target_user:
-                                self.debug_print(f"Found target user {member.name} in voice channel {vc.name}")
+                # Check if target user is in a voice channel
+                target = self._find_target_user_in_guild(guild) if target_lower else None
+                if target and target.voice and target.voice.channel:
+                    self.debug_print(f"Found target user {target.name} in voice channel {target.voice.channel.name}")
             
             return connected
         except Exception as e:
@@ -989,78 +1331,80 @@ class DiscordBot(commands.Bot):
 
     async def _force_direct_connect(self, guild_id: int, channel_id: int) -> bool:
         """Force a direct connection to a voice channel, bypassing connection queue"""
-        try:
-            guild = self.get_guild(guild_id)
-            if not guild:
-                self.debug_print(f"Cannot find guild with ID {guild_id}")
-                return False
+        # Serialize with the connection workers and other connects/disconnects for this guild
+        async with self._connection_lock_for(guild_id):
+            try:
+                guild = self.get_guild(guild_id)
+                if not guild:
+                    self.debug_print(f"Cannot find guild with ID {guild_id}")
+                    return False
             
-            channel = guild.get_channel(channel_id)
-            if not channel:
-                self.debug_print(f"Cannot find channel with ID {channel_id} in guild {guild.name}")
-                return False
+                channel = guild.get_channel(channel_id)
+                if not channel:
+                    self.debug_print(f"Cannot find channel with ID {channel_id} in guild {guild.name}")
+                    return False
             
-            self.debug_print(f"Attempting direct connection to {channel.name} in {guild.name}")
+                self.debug_print(f"Attempting direct connection to {channel.name} in {guild.name}")
             
-            # Disconnect first if already connected
-            if guild.voice_client and guild.voice_client.is_connected():
-                try:
-                    await guild.voice_client.disconnect(force=True)
-                    self.debug_print(f"Disconnected from previous channel in {guild.name}")
-                except Exception as e:
-                    self.debug_print(f"Error disconnecting from previous channel: {e}")
+                # Disconnect first if already connected
+                if guild.voice_client and guild.voice_client.is_connected():
+                    try:
+                        await self._disconnect_and_wait(guild.id, guild.voice_client, force=True)
+                        self.debug_print(f"Disconnected from previous channel in {guild.name}")
+                    except Exception as e:
+                        self.debug_print(f"Error disconnecting from previous channel: {e}")
             
-            # Try to connect with timeout
-            try:
-                voice_client = await channel.connect(timeout=15.0, self_deaf=True)
-                self.debug_print(f"Successfully connected to {channel.name}")
+                # Try to connect with timeout, retrying transient failures with jittered exponential backoff
+                for attempt in range(FORCE_CONNECT_ATTEMPTS):
+                    try:
+                        voice_client = await channel.connect(timeout=15.0, self_deaf=True)
+                        break
+                    except (asyncio.TimeoutError, discord.ClientException) as e:
+                        if attempt == FORCE_CONNECT_ATTEMPTS - 1:
+                            self.debug_print(f"Connection to {channel.name} failed after {FORCE_CONNECT_ATTEMPTS} attempts: {e!r}")
+                            return False
+                        delay = min(30, 2 ** attempt) * (1 + random.random() * 0.5)
+                        self.debug_print(f"Connection attempt {attempt + 1} to {channel.name} failed ({e!r}), retrying in {delay:.1f}s")
+                    
+                        # Drop any half-open voice client first so the retry doesn't hit "Already connected"
+                        if guild.voice_client:
+                            try:
+                                await self._disconnect_and_wait(guild.id, guild.voice_client, force=True)
+                            except Exception as e:
+                                self.debug_print(f"Error disconnecting before retry: {e}")
+                        await asyncio.sleep(delay)
+                    except Exception as e:
+                        self.debug_print(f"Error connecting to {channel.name}: {e}")
+                        return False
+                    
+                try:
+                    self.debug_print(f"Successfully connected to {channel.name}")
                 
-                # Set up audio sink if connection successful
-                if voice_client and voice_client.is_connected():
-                    voice_client.play(discord.PCMAudio(source=silence_source()))
-                    if self.status_callback and hasattr(self.status_callback, 'on_connection_status'):
-                        self.status_callback.on_connection_status(True, f"Connected to {channel.name} in {guild.name}")
-                    return True
-                else:
-                    self.debug_print(f"Connection failed - no voice client after connect")
-                    return False
+                    # Set up audio sink if connection successful
+                    if voice_client and voice_client.is_connected():
+                        voice_client.play(discord.PCMAudio(source=silence_source()))
+                        if self.status_callback and hasattr(self.status_callback, 'on_connection_status'):
+                            self.status_callback.on_connection_status(True, f"Connected to {channel.name} in {guild.name}")
+                        return True
+                    else:
+                        self.debug_print(f"Connection failed - no voice client after connect")
+                        return False
                 
-            except asyncio.TimeoutError:
-                self.debug_print(f"Connection timeout when connecting to {channel.name}")
-                return False
+                except Exception as e:
+                    self.debug_print(f"Error connecting to {channel.name}: {e}")
+                    return False
+            
             except Exception as e:
-                self.debug_print(f"Error connecting to {channel.name}: {e}")
+                self.debug_print(f"Unexpected error in force_direct_connect: {e}")
                 return False
-            
-        except Exception as e:
-            self.debug_print(f"Unexpected error in force_direct_connect: {e}")
-            return False
 
     def get_voice_latency(self):
         """Get voice connection latency in milliseconds"""
         try:
-            for guild_id, voice_client in list(self._voice_clients.items()):
-                if voice_client and voice_client.is_connected():
-                    try:
-                        # Try to get latency
-                        if hasattr(voice_client, 'latency'):
-                            if isinstance(voice_client.latency, float):
-                                # Check for infinity or NaN before converting to int
-                                if math.isinf(voice_client.latency) or math.isnan(voice_client.latency):
-                                    self.debug_print("Voice latency is infinity or NaN, setting to 0")
-                                    return 0
-                                else:
-                                    return int(voice_client.latency * 1000)
-                            elif callable(voice_client.latency):
-                                latency_value = voice_client.latency()
-                                # Check for infinity or NaN before converting to int
-                                if isinstance(latency_value, float) and (math.isinf(latency_value) or math.isnan(latency_value)):
-                                    self.debug_print("Voice latency is infinity or NaN, setting to 0")
-                                    return 0
-                                else:
-                                    return int(latency_value * 1000)
-                    except Exception as e:
-                        self.debug_print(f"Error getting voice latency: {e}")
+            # Tracked clients are dropped as soon as Discord reports that we left the channel
+            for guild_id, voice_client in self._voice_clients.items():
+                if voice_client:
+                    return self._latency_ms(guild_id, voice_client)
         except Exception as e:
             self.debug_print(f"Error in get_voice_latency: {e}")
         
@@ -1086,22 +1430,12 @@ class DiscordBot(commands.Bot):
                 
             message = args[0]
             try:
-                # Initialize OpenAI client
-                import openai
-                
-                # Extract model name from config (default to GPT-3.5-turbo if not specified)
-                model_name = self.config.get('gpt_model', 'gpt-3.5-turbo')
-                # Remove pricing info if present in the model name
-                if "(" in model_name:
-                    model_name = model_name.split("(")[0].strip()
-                
+                # Model name is normalized in reload_config()
+                model_name = self._gpt_model
                 self.debug_print(f"Using model: {model_name} for chat")
                 
-                # Set up OpenAI client
-                client = openai.OpenAI(api_key=self.config.get('openai_api_key', ''))
-                
                 # Send request to OpenAI
-                response = client.chat.completions.create(
+                response = await self.openai_client.chat.completions.create(
                     model=model_name,
                     messages=[
                         {"role": "system", "content": "You are a helpful assistant."},
@@ -1125,15 +1459,17 @@ class DiscordBot(commands.Bot):
                     # Play response through TTS in voice channel
                     try:
                         # Find an active voice client
-                        for guild_id, voice_client in list(self._voice_clients.items()):
-                            if voice_client and voice_client.is_connected():
+                        for guild_id, voice_client in self._voice_clients.items():
+                            if voice_client:
                                 self.debug_print(f"Playing GPT response through voice in guild {guild_id}")
                                 
-                                # Create audio player
-                                audio_player = AudioPlayer(voice_client, self.tts_manager, self.debug_print)
+                                # Get audio player
+                                audio_player = self._audio_player_for(voice_client)
                                 
-                                # Play the response as TTS
-                                asyncio.create_task(audio_player.play_text(reply))
+                                # Play the response as TTS, replacing a reply that is still playing
+                                if self._tts_task is not None and not self._tts_task.done():
+                                    self._tts_task.cancel()
+                                self._tts_task = self._track_task(audio_player.play_text(reply))
                                 break
                         else:
                             self.debug_print("No active voice client found for TTS playback")
@@ -1162,8 +1498,12 @@ class DiscordBot(commands.Bot):
     async def _delayed_status_update(self, guild_id, channel_id):
         """Schedule a delayed status update to ensure UI reflects correct state"""
         try:
-            # Wait a second to let the connection stabilize
-            await asyncio.sleep(1.0)
+            # Wait until Discord reports us in the channel instead of a fixed delay
+            try:
+                await asyncio.wait_for(self._voice_ready_for(guild_id).wait(), timeout=5.0)
+            except asyncio.TimeoutError:
+                self.debug_print("Delayed status update: Voice connection never became ready")
+                return
             
             # Get the guild and channel
             guild = self.get_guild(guild_id)
@@ -1171,7 +1511,7 @@ class DiscordBot(commands.Bot):
                 self.debug_print("Guild not found in delayed status update")
                 return
                 
-            channel = guild.get_channel(channel_id)
+            channel = self._get_channel(guild, channel_id)
             if not channel:
                 self.debug_print("Channel not found in delayed status update")
                 return
@@ -1181,11 +1521,8 @@ class DiscordBot(commands.Bot):
                 self.debug_print("Delayed status update: Still connected, updating UI")
                 
                 # Update UI status
-                if self.status_callback:
-                    self.status_callback("Connected to Discord")
-                if self.channel_callback:
-                    channel_name = channel.name if hasattr(channel, 'name') else f"Channel {channel_id}"
-                    self.channel_callback(f"{channel_name}")
+                channel_name = channel.name if hasattr(channel, 'name') else f"Channel {channel_id}"
+                self._publish_ui_state(status="Connected to Discord", channel=channel_name)
                     
                 # Make sure this connection is in our tracking dictionary
                 self._voice_clients[guild_id] = guild.voice_client
@@ -1204,57 +1541,152 @@ class MySink(voice_recv.AudioSink):
         self.config = config
         self.debug_print = debug_print_func
         self.is_speaking = False
-        self._lock = threading.Lock()
-        self._last_audio_time = time.time()
+        self._lock = threading.Lock()  # Serializes listen/stop_listening/cleanup
+        self._last_audio_time = time.monotonic_ns()  # Only compared against itself, in ns
+        self._user_cache: Dict[int, bool] = {}  # user id -> is the target user
+        
+        # LED updates are coalesced: write() only records the wanted color and a
+        # flush thread sends it to the BlinkStick (at most 60 times a second) when it changed
+        self._pending_packed: Optional[int] = None
+        self._last_sent_packed: Optional[int] = None
+        self._flush_wake = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+        self._flush_stop = False
+        self.reload_config()
+        self._start_flush_thread()
+        
+    def reload_config(self, led_cfg: Optional[LEDConfig] = None):
+        """Resolve the LED settings used for every audio packet from the config"""
+        self.led_cfg = led_cfg or LEDConfig.from_config(self.config)
+        self._led_enabled = self.led_cfg.enabled
+        self._target_user_lc = self.config.get('target_user', '').lower()
+        self._target_packed = _pack_rgb(self.led_cfg.target_voice)
+        self._other_packed = _pack_rgb(self.led_cfg.other_voice)
+        self._user_cache.clear()
+        
+        # Pick the write() variant for these settings so packets skip checks for unused features
+        if not self._led_enabled:
+            self.write = self._write_no_led
+        elif not self._target_user_lc:
+            self.write = self._write_other_voice
+        else:
+            vars(self).pop('write', None)  # General write() below
+        
+    def _is_target(self, user) -> bool:
+        """Whether a speaking user is the target user, normalizing each user's name only once"""
+        is_target = self._user_cache.get(user.id)
+        if is_target is None:
+            if len(self._user_cache) >= USER_CACHE_SIZE:
+                # Evict the oldest speaker
+                del self._user_cache[next(iter(self._user_cache))]
+            is_target = self._user_cache[user.id] = str(user).lower() == self._target_user_lc
+        return is_target
+        
+    def _start_flush_thread(self):
+        """Start the LED flush thread if it is not running"""
+        if self._flush_thread is None or not self._flush_thread.is_alive():
+            self._flush_stop = False
+            self._flush_thread = threading.Thread(target=self._flush_loop, name="LEDFlush", daemon=True)
+            self._flush_thread.start()
+            
+    def _stop_flush_thread(self):
+        """Stop the LED flush thread and wait briefly for it to exit"""
+        self._flush_stop = True
+        self._flush_wake.set()
+        if self._flush_thread is not None and self._flush_thread is not threading.current_thread():
+            self._flush_thread.join(timeout=0.5)
+        self._flush_thread = None
+        
+    def _flush_loop(self):
+        """Send the latest wanted LED color to the BlinkStick whenever it changes"""
+        while True:
+            self._flush_wake.wait()
+            self._flush_wake.clear()
+            if self._flush_stop:
+                break
+            packed = self._pending_packed
+            if packed is not None and packed != self._last_sent_packed:
+                try:
+                    if packed == LED_OFF:
+                        self.led_controller.turn_off()
+                    else:
+                        self.led_controller.set_color(0, 0, (packed >> 16) & 0xff, (packed >> 8) & 0xff, packed & 0xff)
+                    self._last_sent_packed = packed
+                except Exception as e:
+                    self.debug_print(f"Error updating LED: {e}")
+            # Cap the USB update rate
+            time.sleep(1 / 60)
+            
+    def _set_led(self, packed: int):
+        """Ask the flush thread to show a packed color"""
+        # Most packets repeat the color already asked for; skip the Event.set (and its
+        # Condition lock) for those so the receive thread stays lock-free
+        if packed != self._pending_packed:
+            self._pending_packed = packed
+            self._flush_wake.set()
         
     def write(self, data, user=None) -> bool:
         """Process incoming audio data"""
+        # Called from the voice receive thread for every packet, so it takes no lock:
+        # is_speaking and _last_audio_time are single assignments and readers only
+        # need the latest value
         try:
-            with self._lock:
-                # Process audio data
-                if isinstance(data, (bytes, bytearray)) and len(data) > 0:
-                    self.is_speaking = True
-                    self._last_audio_time = time.time()
-                    
-                    # Update LED if enabled
-                    if self.config.get('led_enabled', False):
-                        # Use different colors for target user vs others
-                        if user and str(user).lower() == self.config.get('target_user', '').lower():
-                            color = self.config.get('led_colors', {}).get('target_voice', 
-                                                                        {'red': 255, 'green': 0, 'blue': 0})
-                            self.led_controller.set_color(0, 0, 
-                                                        color.get('red', 0),
-                                                        color.get('green', 0),
-                                                        color.get('blue', 0))
-                        else:
-                            color = self.config.get('led_colors', {}).get('other_voice',
-                                                                        {'red': 0, 'green': 0, 'blue': 255})
-                            self.led_controller.set_color(0, 0, 
-                                                        color.get('red', 0),
-                                                        color.get('green', 0),
-                                                        color.get('blue', 0))
-                    return True
-                else:
-                    # No audio data, check if we should stop speaking
-                    if self.is_speaking and time.time() - self._last_audio_time > 0.1:
-                        self.is_speaking = False
-                        self.led_controller.turn_off()
-                    return True
+            # Process audio data
+            if isinstance(data, (bytes, bytearray)) and len(data) > 0:
+                self.is_speaking = True
+                self._last_audio_time = time.monotonic_ns()
                 
+                # Update LED if enabled, using different colors for target user vs others
+                if self._led_enabled:
+                    self._set_led(self._target_packed if user is not None and self._is_target(user) else self._other_packed)
+                return True
+            else:
+                # No audio data, check if we should stop speaking
+                self._on_silence()
+                return True
+            
         except Exception as e:
             self.debug_print(f"Error processing audio data: {e}")
             return False
+            
+    def _write_no_led(self, data, user=None) -> bool:
+        """write() used while the LED is disabled"""
+        if isinstance(data, (bytes, bytearray)) and len(data) > 0:
+            self.is_speaking = True
+            self._last_audio_time = time.monotonic_ns()
+        else:
+            self._on_silence()
+        return True
+        
+    def _write_other_voice(self, data, user=None) -> bool:
+        """write() used when no target user is set, so every speaker gets the other voice color"""
+        if isinstance(data, (bytes, bytearray)) and len(data) > 0:
+            self.is_speaking = True
+            self._last_audio_time = time.monotonic_ns()
+            self._set_led(self._other_packed)
+        else:
+            self._on_silence()
+        return True
+        
+    def _on_silence(self):
+        """Stop speaking once no audio has arrived for 100 ms"""
+        if self.is_speaking and time.monotonic_ns() - self._last_audio_time > 100_000_000:
+            self.is_speaking = False
+            self._set_led(LED_OFF)
 
     def cleanup(self):
         """Clean up resources"""
         with self._lock:
             try:
-                # Turn off LED
+                # Stop LED updates, then turn off LED
+                self._stop_flush_thread()
                 self.led_controller.turn_off()
+                self._pending_packed = self._last_sent_packed = None
                 
                 # Reset state
+                self._user_cache.clear()
                 self.is_speaking = False
-                self._last_audio_time = time.time()
+                self._last_audio_time = time.monotonic_ns()
                 
             except Exception as e:
                 self.debug_print(f"Error in audio sink cleanup: {e}")
@@ -1271,13 +1703,16 @@ class MySink(voice_recv.AudioSink):
     def listen(self):
         """Start listening for audio"""
         with self._lock:
+            self._start_flush_thread()
             self.debug_print("Audio sink listening enabled")
             
     def stop_listening(self):
         """Stop listening for audio"""
         with self._lock:
             self.debug_print("Audio sink listening disabled")
-            self.led_controller.turn_off() 
+            self._stop_flush_thread()
+            self.led_controller.turn_off()
+            self._pending_packed = self._last_sent_packed = None
 
     async def toggle_mute(self):
         """Toggle mute state"""
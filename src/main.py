@@ -1,6 +1,7 @@
 import os
 import sys
 import json
+import re
 import asyncio
 import logging
 import time
@@ -8,6 +9,7 @@ import threading
 from typing import Dict, Any, Optional
 from pathlib import Path
 import queue
+import concurrent.futures
 
 # Add the src directory to Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -19,24 +21,26 @@ systray = None
 from src.bot.discord_bot import DiscordBot
 from src.ui.systray import SystrayManager
 
+# Noisy messages kept out of the console and bot.log
+SUPPRESSED_MESSAGES = [
+    "Retrying channel update:",
+    "Received channel update:",
+    "Queuing channel update for after window initialization",
+    "Applying pending channel update:",
+    "Found active connection in channel"
+]
+# One alternation so each message is scanned once, however many patterns there are
+SUPPRESS_RE = re.compile('|'.join(re.escape(pattern) for pattern in SUPPRESSED_MESSAGES))
+
 # Custom log filter to suppress noisy messages
 class SuppressFilter(logging.Filter):
     def __init__(self):
         super().__init__()
-        self.suppressed_messages = [
-            "Retrying channel update:",
-            "Received channel update:",
-            "Queuing channel update for after window initialization",
-            "Applying pending channel update:",
-            "Found active connection in channel"
-        ]
+        self.suppressed_messages = SUPPRESSED_MESSAGES
     
     def filter(self, record):
-        msg = record.getMessage()
-        for pattern in self.suppressed_messages:
-            if pattern in msg:
-                return False  # Suppress this message
-        return True  # Allow all other messages
+        # Suppress messages containing any of the patterns, allow all others
+        return SUPPRESS_RE.search(record.getMessage()) is None
 
 def setup_logging() -> None:
     """Configure logging"""
@@ -61,6 +65,43 @@ def setup_logging() -> None:
     root_logger = logging.getLogger()
     root_logger.addFilter(suppress_filter)
 
+# Debug messages waiting to be written by the log writer thread; bounded so a
+# flood of messages cannot grow memory without limit
+LOG_QUEUE_SIZE = 4096
+LOG_BATCH_SIZE = 64
+_log_queue: "queue.Queue[str]" = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+
+def _log_writer() -> None:
+    """Drain queued debug messages to the logger and status window off the caller's thread"""
+    logger = logging.getLogger(__name__)
+    while True:
+        # Wait for a message, then take whatever else is already queued
+        batch = [_log_queue.get()]
+        try:
+            while len(batch) < LOG_BATCH_SIZE:
+                batch.append(_log_queue.get_nowait())
+        except queue.Empty:
+            pass
+            
+        status_window = getattr(systray, 'status_window', None) if systray else None
+        for msg in batch:
+            # Skip suppressed messages before a log record is built for them; SuppressFilter
+            # still catches them from other loggers. The UI handles its own filtering
+            if SUPPRESS_RE.search(msg) is None:
+                logger.info(msg)
+            if status_window:
+                try:
+                    status_window.add_log(msg)
+                except Exception as e:
+                    logger.error(f"Error adding log to status window: {e}")
+
+def debug_print(msg: str) -> None:
+    """Debug print function that logs to both logger and status window"""
+    try:
+        _log_queue.put_nowait(msg)
+    except queue.Full:
+        pass  # Writer is far behind; drop the message rather than block the caller
+
 def load_config(config_path: str = 'config.json') -> Dict[str, Any]:
     """Load configuration from JSON file"""
     try:
@@ -134,6 +175,36 @@ def toggle_mute_callback(is_muted):
     except Exception as e:
         debug_print(f"Error in PTT toggle: {e}")
 
+def _run_led_test(key=None, color=None):
+    """Run an LED test on a worker thread so the UI doesn't freeze while it plays"""
+    if bot is None:
+        return
+    led_controller = bot.led_controller
+    
+    def run():
+        try:
+            if key is None:
+                # No color given: show every configured color
+                led_controller.test_sequence(bot.config)
+            else:
+                led_controller.set_color(0, 0,
+                                         color.get('red', 0),
+                                         color.get('green', 0),
+                                         color.get('blue', 0))
+                time.sleep(0.5)
+                led_controller.turn_off()
+        except Exception as e:
+            debug_print(f"Error running LED test: {e}")
+            
+    threading.Thread(target=run, name="led-test", daemon=True).start()
+
+# How long quitting waits for the bot to disconnect and close before forcing an exit
+BOT_CLEANUP_TIMEOUT = 2.0
+
+async def _shutdown_bot() -> None:
+    """Clean up the bot and wait for it to close; bot.start() returns once it has"""
+    await asyncio.wait_for(bot.cleanup(), timeout=BOT_CLEANUP_TIMEOUT)
+
 async def cleanup():
     """Clean up resources"""
     global bot, systray
@@ -163,7 +234,7 @@ async def cleanup():
             except Exception as e:
                 logging.error(f"Error during systray cleanup: {e}")
         
-        # Start bot cleanup but don't wait for completion
+        # Clean up the bot and wait for it to finish
         logging.info("Starting bot cleanup...")
         if bot:
             try:
@@ -176,15 +247,14 @@ async def cleanup():
                         except Exception as e:
                             logging.error(f"Error clearing voice handler: {e}")
                 
-                # Start cleanup but don't wait for completion
-                if hasattr(bot, 'cleanup'):
-                    asyncio.create_task(bot.cleanup())
+                await _shutdown_bot()
+                logging.info("Bot cleanup completed")
+            except asyncio.TimeoutError:
+                # Cleanup is stuck; force exit as a last resort
+                logging.error("Bot cleanup timed out, forcing exit...")
+                os._exit(1)
             except Exception as e:
-                logging.error(f"Error initiating bot cleanup: {e}")
-        
-        # Brief delay to allow cleanup to start
-        logging.info("Waiting briefly for cleanup tasks to start...")
-        await asyncio.sleep(0.2)
+                logging.error(f"Error during bot cleanup: {e}")
         
     except Exception as e:
         logging.error(f"Error during cleanup: {e}")
@@ -192,9 +262,6 @@ async def cleanup():
         # Ensure all references are cleared
         bot = None
         systray = None
-        logging.info("Forcing exit...")
-        # Force exit as a last resort
-        os._exit(0)
 
 async def main():
     """Main entry point"""
@@ -204,6 +271,7 @@ async def main():
         # Setup logging
         setup_logging()
         logger = logging.getLogger(__name__)
+        threading.Thread(target=_log_writer, name="log-writer", daemon=True).start()
         
         # Load config
         config = load_config()
@@ -243,10 +311,9 @@ async def main():
                     except Exception as e:
                         logger.error(f"Error stopping systray: {e}")
                 
-                # Then cleanup the bot - do this in a non-blocking way
+                # Then cleanup the bot on its event loop and wait for it to finish
                 logger.info("Starting bot cleanup...")
                 if bot:
-                    # Schedule cleanup in event loop but don't wait for it
                     if hasattr(bot, 'loop') and bot.loop and not bot.loop.is_closed():
                         # First, clear voice handlers to prevent callbacks during disconnect
                         if hasattr(bot, '_voice_clients'):
@@ -257,37 +324,24 @@ async def main():
                                 except Exception as e:
                                     logger.error(f"Error clearing voice state handler: {e}")
                         
-                        # Schedule but don't wait for cleanup
-                        bot.loop.call_soon_threadsafe(
-                            lambda: asyncio.create_task(bot.cleanup())
-                        )
-                
-                # Give cleanup a moment to start but don't wait for completion
-                logger.info("Waiting briefly for cleanup to start...")
-                time.sleep(0.2)
+                        # Once the bot has closed, bot.start() returns and main() exits normally
+                        asyncio.run_coroutine_threadsafe(_shutdown_bot(), bot.loop).result(
+                            timeout=BOT_CLEANUP_TIMEOUT + 0.5)
+                        logger.info("Bot cleanup completed")
+                        return
                 
-                # Force exit to ensure all threads terminate
-                logger.info("Forcing exit...")
+                # No running bot to wait for
+                logger.info("Exiting...")
                 os._exit(0)
                 
+            except (asyncio.TimeoutError, concurrent.futures.TimeoutError):
+                logger.error("Bot cleanup timed out, forcing exit...")
+                os._exit(1)
             except Exception as e:
                 logger.error(f"Error during quit: {e}")
                 # Force exit on error
                 os._exit(1)
             
-        def debug_print(msg: str):
-            """Debug print function that logs to both logger and status window"""
-            # Filter patterns for console logging are already handled by SuppressFilter
-            # We only log to the console, then the UI handles its own filtering
-            logger.info(msg)
-            if systray:
-                status_window = getattr(systray, 'status_window', None)
-                if status_window:
-                    try:
-                        status_window.add_log(msg)
-                    except Exception as e:
-                        logger.error(f"Error adding log to status window: {e}")
-            
         systray = SystrayManager(config, quit_callback, toggle_mute_callback, debug_print)
         
         # Create bot with status callbacks
@@ -303,17 +357,7 @@ async def main():
             mute_toggle=toggle_mute_callback,
             join_channel=None,  # TODO: Implement
             leave_channel=None,  # TODO: Implement
-            led_test=lambda key=None, color=None: (
-                bot.led_controller.test_sequence(config) if key is None
-                else (
-                    bot.led_controller.set_color(0, 0, 
-                                               color.get('red', 0),
-                                               color.get('green', 0),
-                                               color.get('blue', 0)),
-                    time.sleep(0.5),
-                    bot.led_controller.turn_off()
-                )[-1]  # Return value of last expression
-            ),
+            led_test=_run_led_test,
             debug_toggle=None,  # TODO: Implement
             test_announcement=lambda: asyncio.run_coroutine_threadsafe(
                 bot.process_command('test_announcement'), bot.loop),
@@ -322,7 +366,10 @@ async def main():
             reconnect=lambda: asyncio.run_coroutine_threadsafe(
                 bot.reconnect_voice(), bot.loop),
             chat_callback=lambda cmd, message: asyncio.run_coroutine_threadsafe(
-                bot.process_command(cmd, message), bot.loop)
+                bot.process_command(cmd, message), bot.loop),
+            status_applied=lambda status: (
+                bot.notify_ui_ready() if status == "Connected to Discord" else None),
+            config_changed=bot.reload_config
         )
         
         # Set additional systray callbacks
@@ -330,7 +377,8 @@ async def main():
             on_disconnect=lambda: asyncio.run_coroutine_threadsafe(
                 bot.disconnect_voice(), bot.loop),
             on_reconnect=lambda: asyncio.run_coroutine_threadsafe(
-                bot.reconnect_voice(), bot.loop)
+                bot.reconnect_voice(), bot.loop),
+            on_config_changed=bot.reload_config
         )
         
         # Start the systray after setting up callbacks
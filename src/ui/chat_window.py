@@ -1,7 +1,9 @@
 import tkinter as tk
 from tkinter import ttk
-import datetime
-from typing import Callable, List, Tuple, Optional
+import time
+import threading
+from collections import deque
+from typing import Callable, Deque, List, Tuple, Optional
 from ..audio.playback import AudioPlayer
 
 class ChatWindow(ttk.Frame):
@@ -12,7 +14,11 @@ class ChatWindow(ttk.Frame):
         self.audio_player = audio_player
         self.gpt_callback = gpt_callback
         self.debug_print = debug_print_func
-        self.chat_history: List[Tuple[str, str, str]] = []  # (sender, message, timestamp)
+        # (sender, message, timestamp), bounded like the displayed text
+        self.chat_history: Deque[Tuple[str, str, str]] = deque(maxlen=1000)
+        self._pending: List[str] = []  # Formatted messages waiting for the next flush
+        self._flush_scheduled = False
+        self._line_count = 0  # Lines in chat_text, tracked so the cap check needn't ask Tk
         
         self._create_widgets()
         
@@ -57,9 +63,20 @@ class ChatWindow(ttk.Frame):
         # Add user message to chat
         self.add_to_chat("You", message)
         
-        # Get response from GPT (this should be handled asynchronously)
-        response = self.gpt_callback(message)
+        # Get response from GPT in the background so the window stays responsive
+        threading.Thread(target=self._run_gpt, args=(message,), daemon=True).start()
         
+    def _run_gpt(self, message: str):
+        """Wait for the GPT response off the UI thread, then hand it back to the UI thread"""
+        try:
+            response = self.gpt_callback(message)
+        except Exception as e:
+            self.debug_print(f"Error getting GPT response: {e}")
+            response = f"Error: {e}"
+        self.after(0, self._post_response, response)
+        
+    def _post_response(self, response: str):
+        """Show and speak a GPT response (UI thread)"""
         # Add GPT response to chat
         self.add_to_chat("GPT", response)
         
@@ -68,10 +85,8 @@ class ChatWindow(ttk.Frame):
         
     def add_to_chat(self, sender: str, message: str):
         """Add a message to the chat display"""
-        self.chat_text.configure(state='normal')
-        
         # Add timestamp
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+        timestamp = time.strftime("%H:%M:%S")
         
         # Format message
         formatted_message = f"[{timestamp}] {sender}: {message}\n\n"
@@ -79,12 +94,29 @@ class ChatWindow(ttk.Frame):
         # Add to chat history
         self.chat_history.append((sender, message, timestamp))
         
-        # Add to display
-        self.chat_text.insert(tk.END, formatted_message)
-        
-        # Keep only last 1000 lines
-        if float(self.chat_text.index('end-1c').split('.')[0]) > 1000:
-            self.chat_text.delete('1.0', '2.0')
+        # Add to display once Tk is idle, together with any other messages added meanwhile
+        self._pending.append(formatted_message)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after_idle(self._flush)
+            
+    def _flush(self):
+        """Insert all pending messages into the chat display in one go"""
+        self._flush_scheduled = False
+        if not self._pending:
+            return
+            
+        text = ''.join(self._pending)
+        self._pending.clear()
+        self.chat_text.configure(state='normal')
+        self.chat_text.insert(tk.END, text)
+        self._line_count += text.count('\n')
+        
+        # Keep only last 1000 lines, trimming the overflow in one delete
+        overflow = self._line_count - 1000
+        if overflow > 0:
+            self.chat_text.delete('1.0', f'{overflow + 1}.0')
+            self._line_count = 1000
             
         # Scroll to bottom
         self.chat_text.see(tk.END)
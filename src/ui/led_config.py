@@ -39,6 +39,8 @@ class LEDColorConfig:
         self.preview = tk.Canvas(main_frame, width=200, height=50,
                                highlightthickness=1, highlightbackground='gray')
         self.preview.pack(fill='x', pady=10)
+        self._preview_rect = self.preview.create_rectangle(0, 0, 200, 50, outline='')
+        self._preview_after_id = None  # Pending preview redraw while a slider is dragged
         self._update_preview()
         
         # Button frame
@@ -58,13 +60,15 @@ class LEDColorConfig:
         
     def _on_color_change(self, _=None):
         """Handle color slider changes"""
-        self._update_preview()
+        # Redraw at most once per frame while dragging
+        if self._preview_after_id is not None:
+            self.window.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.window.after(16, self._update_preview)
         
     def _update_preview(self):
         """Update the color preview"""
-        color = self._get_current_color_hex()
-        self.preview.delete('all')
-        self.preview.create_rectangle(0, 0, 200, 50, fill=color, outline='')
+        self._preview_after_id = None
+        self.preview.itemconfigure(self._preview_rect, fill=self._get_current_color_hex())
         
     def _get_current_color(self) -> Dict[str, int]:
         """Get current RGB values"""
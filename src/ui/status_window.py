@@ -4,9 +4,10 @@ import win32gui
 import win32con
 from typing import Dict, Any, Callable, Optional
 import threading
-import queue
+import collections
 import datetime
 import json
+import re
 import psutil
 import time
 import os
@@ -14,36 +15,60 @@ from PIL import Image, ImageTk
 import sys
 import tkinter.messagebox
 
-# Monkey patch tkinter.Variable.__del__ to avoid "main thread is not in main loop" warnings
-original_variable_del = tk.Variable.__del__
+# System stats refresh interval in seconds; the sampler reads psutil at the same cadence
+STATS_INTERVAL = 10.0
 
-def patched_variable_del(self):
-    """Patched version of tkinter.Variable.__del__ that doesn't raise exceptions during cleanup"""
-    try:
-        # Only call the original __del__ if we're not in the middle of interpreter shutdown
-        # and if the tkinter interpreter still exists
-        if not (self._tk._tkrunning == 0 or not hasattr(self._tk, 'call')):
-            original_variable_del(self)
-    except (RuntimeError, TypeError, AttributeError):
-        # Ignore any errors during garbage collection
-        pass
+# Lines kept in the log tab
+LOG_MAX_LINES = 5000
 
-# Apply the monkey patch
-tk.Variable.__del__ = patched_variable_del
+# Verbose log messages hidden from the log tab unless debug mode is on
+LOG_FILTER_PATTERNS = [
+    "Retrying channel update:",
+    "Received channel update:",
+    "Queuing channel update for after window initialization",
+    "Applying pending channel update:",
+    "Found active connection in channel",
+    "Found active voice client in guild",
+    "Target user is in voice channel:",
+    "Already connected to channel",
+    "Successfully connected to voice channel",
+    "Error cleaning up temp file:",
+    "Processing command: callback with args:",
+    "Error getting latency:",
+    "Voice latency is infinity or NaN, setting to 0"
+]
+LOG_FILTER_RE = re.compile('|'.join(re.escape(pattern) for pattern in LOG_FILTER_PATTERNS))
 
 class StatusWindow:
     def __init__(self, config: Dict[str, Any], debug_print_func: Callable = print):
         self.config = config
         self.debug_print = debug_print_func
+        self._debug_mode = bool(config.get('debug_mode', False))  # Cached for add_log; see set_debug_mode
+        self.root = None  # Tk root, created on the UI thread
         self.window = None
-        self.command_queue = queue.Queue()
+        self.exit_flag = threading.Event()  # Set on cleanup; stops the UI and sampler threads
+        # Commands for the UI thread; deque append/popleft are atomic, so no Queue locking is needed
+        self.command_queue = collections.deque()
+        self._drain_scheduled = False  # Set while a queue drain is waiting to run on the UI thread
         self.is_visible = False
+        self._hidden_latest = {}  # Latest status/channel held back while the window is hidden, replayed on show
         self.log_text = None
+        self._tab_builders = {}  # Notebook tab name -> (builder, frame) for tabs not built yet
         self.start_time = datetime.datetime.now()
+        self._last_uptime_seconds = -1  # Uptime second currently shown in uptime_var
         self.is_connected = False  # Track connection state
         self.is_muted = False  # Track mute state
         self._pending_status_updates = []  # Store updates until UI is ready
-        self._log_buffer = []  # Buffer for storing logs before window is created
+        # Formatted log lines waiting to be shown; also holds logs from before the window is created
+        self._log_buffer = collections.deque(maxlen=LOG_MAX_LINES)
+        self._log_flush_scheduled = False  # Set while a _flush_logs call is pending
+        self._ts_sec = 0  # Second of the cached log timestamp
+        self._ts_str = ''  # Log timestamp formatted for that second
+        self._stats_after_id = None  # Pending system stats refresh, only scheduled while visible
+        self._proc = psutil.Process()  # This process, kept so stats don't re-open it on every refresh
+        # Latest system stats, written by the sampler thread and only read by the UI thread
+        self._stats: Dict[str, Optional[float]] = {'mem_mb': None}
+        self._stats_wanted = threading.Event()  # Set while the window is shown; the sampler idles otherwise
         
         # Status variables - initialize all to None
         self.status_var = None
@@ -71,6 +96,8 @@ class StatusWindow:
         self.on_disconnect = None
         self.on_reconnect = None
         self.on_chat_message = None
+        self.on_status_applied = None
+        self.on_config_changed = None
         
         # Button references
         self.mute_button = None
@@ -86,6 +113,10 @@ class StatusWindow:
         self.ui_ready = threading.Event()
         self.ui_thread.start()
         self.ui_ready.wait()  # Wait for UI thread to be ready
+        
+        # Sample system stats off the UI thread
+        self.sampler_thread = threading.Thread(target=self._sample_stats, name="stats-sampler", daemon=True)
+        self.sampler_thread.start()
 
     def _run_ui(self):
         """Run the UI in a separate thread"""
@@ -108,8 +139,9 @@ class StatusWindow:
                 "warning": {"foreground": "#FFFF00", "background": "#303030"}  # Bright yellow on dark gray
             }
             
-            # Add exit flag checking to the mainloop
-            self.exit_flag = threading.Event()
+            # Build the window up front (hidden) so the first show is just a deiconify;
+            # hide only withdraws it, so it is reused from then on
+            self._create_window()
             
             # Signal that the UI thread is ready
             self.ui_ready.set()
@@ -119,12 +151,12 @@ class StatusWindow:
             
             # Check for exit flag periodically
             def check_exit():
-                if hasattr(self, 'exit_flag') and self.exit_flag.is_set():
+                if self.exit_flag.is_set():
                     self.debug_print("Exit flag detected, closing UI thread")
-                    if hasattr(self, 'root') and self.root:
+                    if self.root is not None:
                         self.root.quit()
                         return
-                if hasattr(self, 'root') and self.root:
+                if self.root is not None:
                     self.root.after(100, check_exit)
             
             # Start exit checker
@@ -134,6 +166,9 @@ class StatusWindow:
             self.root.mainloop()
             self.debug_print("UI thread mainloop exited")
             
+            # Tear Tk down here, on the thread that owns it
+            self._destroy_ui()
+            
         except Exception as e:
             self.debug_print(f"Error in UI thread: {e}")
         finally:
@@ -142,7 +177,7 @@ class StatusWindow:
     def set_callbacks(self, mute_toggle=None, join_channel=None, 
                      leave_channel=None, led_test=None, debug_toggle=None,
                      test_announcement=None, disconnect=None, reconnect=None,
-                     chat_callback=None):
+                     chat_callback=None, status_applied=None, config_changed=None):
         """Set callback functions for buttons"""
         self.on_mute_toggle = mute_toggle
         self.on_join_channel = join_channel
@@ -153,16 +188,41 @@ class StatusWindow:
         self.on_disconnect = disconnect
         self.on_reconnect = reconnect
         self.on_chat_message = chat_callback
-        
+        self.on_status_applied = status_applied
+        self.on_config_changed = config_changed
+        
+    def post_command(self, cmd: str, args=None):
+        """Queue a command for the UI thread and wake it up to process the queue"""
+        self.command_queue.append((cmd, args))
+        self._schedule_drain()
+        
+    def _schedule_drain(self):
+        """Schedule a _process_events run unless one is already pending"""
+        # One wakeup per burst: later commands ride along with the drain already scheduled
+        if not self._drain_scheduled and self.root is not None:
+            self._drain_scheduled = True
+            try:
+                self.root.after_idle(self._process_events)
+            except (RuntimeError, tk.TclError):
+                # UI is shutting down
+                self._drain_scheduled = False
+                
     def _process_events(self):
-        """Process events in the UI thread"""
+        """Process queued commands in the UI thread"""
+        # Cleared before draining so commands posted from now on schedule a new drain
+        self._drain_scheduled = False
+        # Only the latest status/channel of a drain matters, so those are held back and
+        # applied once at the end (in the order they last arrived); log lines are inserted together
+        latest = {}
+        log_batch = []
         try:
-            # Process all pending commands
-            while True:
+            # Process all pending commands; a failing command is logged and skipped so it
+            # can't take the rest of the drain down with it
+            while self.command_queue:
+                cmd, args = self.command_queue.popleft()
                 try:
-                    cmd, args = self.command_queue.get_nowait()
                     # Reduce log verbosity for common commands
-                    if cmd not in ('status', 'channel', 'show'):
+                    if cmd not in ('status', 'channel', 'show', 'log'):
                         self.debug_print(f"Processing command: {cmd} with args: {args}")
                     
                     if cmd == 'show':
@@ -175,47 +235,99 @@ class StatusWindow:
                             self.window.lift()
                             self.is_visible = True
                             
+                        if self.is_visible and self._hidden_latest:
+                            # Replay what came in while hidden, ahead of anything already drained
+                            for key, value in latest.items():
+                                self._hidden_latest.pop(key, None)
+                                self._hidden_latest[key] = value
+                            latest, self._hidden_latest = self._hidden_latest, {}
+                            
+                        # Resume system stats sampling and refresh now that the window is visible
+                        if self.is_visible:
+                            self._stats_wanted.set()
+                            if self._stats_after_id is None:
+                                self._update_system_stats()
+                            
                     elif cmd == 'hide' and self.window:
                         self.window.withdraw()
                         self.is_visible = False
+                        self._stats_wanted.clear()
                         
-                    elif cmd == 'status':
+                    elif cmd == 'status' and args.startswith("chat_response:"):
+                        # Every chat response is shown, so these are not coalesced
                         self.update_status(args)
                         
-                    elif cmd == 'channel':
-                        self.update_channel(args)
-                        if args != "Not connected":
-                            # If we have a channel, we're definitely connected
-                            self.update_status("Connected to Discord")
-                            
-                    elif cmd == 'log' and self.log_text:
-                        self.log_text.config(state='normal')
-                        self.log_text.insert('end', args + '\n')
-                        self.log_text.see('end')
-                        self.log_text.config(state='disabled')
+                    elif cmd in ('status', 'channel'):
+                        latest.pop(cmd, None)
+                        latest[cmd] = args
+                        
+                    elif cmd == 'log':
+                        log_batch.append(args)
                         
                     elif cmd == 'callback':
                         args()
                         
-                except queue.Empty:
-                    break
-
-            # Always update system stats periodically
-            self._update_system_stats()
+                except Exception as e:
+                    self.debug_print(f"Error processing command {cmd}: {e}")
+                    
+            for cmd, args in latest.items():
+                try:
+                    if not self.is_visible:
+                        # Don't touch the widgets while hidden, just keep the latest values for the
+                        # next show; the connection state is still tracked right away
+                        self._apply_connection_state(cmd, args)
+                        self._hidden_latest.pop(cmd, None)
+                        self._hidden_latest[cmd] = args
+                        if cmd == 'status' and self.on_status_applied:
+                            # Nothing to wait for on screen, so don't hold up the caller
+                            self.on_status_applied(args)
+                    elif cmd == 'status':
+                        self.update_status(args)
+                    else:
+                        self.update_channel(args)
+                        if args and args != "Not connected":
+                            # If we have a channel, we're definitely connected
+                            self.update_voice_channel(args, is_connected=True)
+                            self.update_status("Connected to Discord")
+                except Exception as e:
+                    self.debug_print(f"Error applying {cmd} update: {e}")
+                        
+            if log_batch:
+                # Same path as add_log: one insert and one scroll for the whole batch
+                self._log_buffer.extend(line + '\n' for line in log_batch)
+                self._flush_logs()
                 
         except Exception as e:
             self.debug_print(f"Error processing events: {e}")
-            
         finally:
-            # Schedule next update (reduced polling frequency from 100ms to 250ms)
-            if self.root:
-                self.root.after(250, self._process_events)
+            # Anything still queued (e.g. posted by a callback during this drain after an error)
+            # would otherwise wait for an unrelated post_command to wake us
+            if self.command_queue:
+                self._schedule_drain()
+            
+    def _apply_connection_state(self, cmd: str, args):
+        """Track is_connected/start_time for a status or channel command without touching widgets"""
+        if cmd == 'status':
+            status = args.lower()
+            if "connected" in status and "dis" not in status:
+                self.is_connected = True
+            elif "error" in status or "dis" in status:
+                self.is_connected = False
+        elif args and args != "Not connected":
+            if not self.is_connected:
+                # Newly connected: uptime counts from here, as in update_voice_channel
+                self.start_time = datetime.datetime.now()
+            self.is_connected = True
+        else:
+            self.is_connected = False
             
     def _create_window(self):
         """Create the status window"""
         try:
             # Create new Toplevel window
             self.window = tk.Toplevel(self.root)
+            # Kept hidden while it is built; callers deiconify it when it should be shown
+            self.window.withdraw()
             self.window.title("Discord Voice Assistant")
             
             # Set window position from config
@@ -254,12 +366,16 @@ class StatusWindow:
             self.notebook.add(chat_tab, text='Chat')
             self.notebook.add(led_tab, text='LED Config')
             
-            # Create tab contents
+            # Create tab contents. Status and Chat are built now since they receive updates;
+            # the others are built the first time they are selected (logs wait in _log_buffer)
             self._create_status_tab(status_tab)
-            self._create_settings_tab(settings_tab)
-            self._create_logs_tab(logs_tab)
             self._create_chat_tab(chat_tab)
-            self._create_led_tab(led_tab)
+            self._tab_builders = {
+                str(settings_tab): (self._create_settings_tab, settings_tab),
+                str(logs_tab): (self._create_logs_tab, logs_tab),
+                str(led_tab): (self._create_led_tab, led_tab),
+            }
+            self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
             
             # Create bottom button frame (outside notebook)
             button_frame = ttk.Frame(main_container)
@@ -277,20 +393,17 @@ class StatusWindow:
                                  win32con.WS_EX_TOOLWINDOW)
             
             # Set minimum window size
-            self.window.update_idletasks()
             self.window.minsize(400, 500)
             
             # Set up window close handler
             self.window.protocol("WM_DELETE_WINDOW", self.hide)
             
-            # Update window to ensure all widgets are properly displayed
-            self.window.update()
-            
-            # Start updating UI stats - do this immediately after UI is ready
-            self._update_system_stats()
+            # Settle geometry once; a full update() here would process events and redraw
+            # while the layout is still settling
+            self.window.update_idletasks()
             
             # Process any pending status updates
-            if hasattr(self, '_pending_status_updates') and self._pending_status_updates:
+            if self._pending_status_updates:
                 for status in self._pending_status_updates:
                     self._process_status_update(status)
                 self._pending_status_updates.clear()
@@ -298,11 +411,11 @@ class StatusWindow:
             # Force a refresh of connection status
             if self.is_connected:
                 self.update_status("Connected to Discord")
-                if hasattr(self, 'channel_var') and self.channel_var.get() != "Not connected":
+                if self.channel_var is not None and self.channel_var.get() != "Not connected":
                     # Update color to green
-                    if hasattr(self, 'channel_label'):
+                    if self.channel_label is not None:
                         self.channel_label.configure(foreground='green')
-                    if hasattr(self, 'quality_label'):
+                    if self.quality_label is not None:
                         self.quality_label.configure(foreground='green')
                         self.quality_var.set("Connected")
             
@@ -315,6 +428,16 @@ class StatusWindow:
                 self.window = None
             return False
             
+    def _on_tab_changed(self, event=None):
+        """Build a tab's contents the first time it is selected"""
+        try:
+            builder = self._tab_builders.pop(self.notebook.select(), None)
+            if builder:
+                create_tab, frame = builder
+                create_tab(frame)
+        except Exception as e:
+            self.debug_print(f"Error building tab: {e}")
+            
     def _create_status_tab(self, parent):
         """Create the status tab content"""
         # Add padding around the entire tab
@@ -339,8 +462,7 @@ class StatusWindow:
         self.status_indicator.pack_propagate(False)
         
         # Round the corners by drawing a circle on it
-        # Ensure indicator size is fixed
-        self.status_indicator.update()
+        # Indicator size is fixed by pack_propagate(False); geometry settles with the window
         
         # Bot Status text
         ttk.Label(bot_frame, text="Bot Status: ", font=('TkDefaultFont', 9, 'bold')).pack(side='left')
@@ -528,6 +650,7 @@ class StatusWindow:
             self.config['target_user'] = self.target_user_var.get()
             self.config['listen_all_users'] = self.listen_all_var.get()
             self.config['debug_mode'] = self.debug_var.get()
+            self._debug_mode = bool(self.config['debug_mode'])
             self.config['hotkey'] = self.hotkey_var.get()
             
             # Extract just the model name from the combo box selection
@@ -536,8 +659,9 @@ class StatusWindow:
             self.config['gpt_model'] = model_name
             
             # Save to file
-            with open('config.json', 'w') as f:
-                json.dump(self.config, f, indent=4)
+            self._save_config()
+            if self.on_config_changed:
+                self.on_config_changed()
             
             self.debug_print("Settings saved successfully")
             
@@ -568,17 +692,7 @@ class StatusWindow:
         self._clear_logs()
         
         # Display buffered logs that occurred before UI was created
-        if hasattr(self, '_log_buffer') and self._log_buffer:
-            self.log_text.config(state='normal')
-            for log_message in self._log_buffer:
-                if "WARNING:" in log_message:
-                    self.log_text.insert('end', log_message, "warning")
-                else:
-                    self.log_text.insert('end', log_message)
-            self.log_text.see('end')
-            self.log_text.config(state='disabled')
-            # Clear buffer after showing logs
-            self._log_buffer = []
+        self._flush_logs()
             
         # Controls frame
         controls_frame = ttk.Frame(main_frame)
@@ -596,63 +710,77 @@ class StatusWindow:
             self.log_text.delete(1.0, tk.END)
             self.log_text.config(state='disabled')
             
+    def _save_config(self):
+        """Write the config to config.json atomically (temp file + os.replace)"""
+        data = json.dumps(self.config, indent=4).encode('utf-8')
+        tmp_path = 'config.json.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        # An interrupted save leaves the old config.json in place instead of a truncated one
+        os.replace(tmp_path, 'config.json')
+        
     def add_log(self, message: str):
         """Add a message to the log"""
         try:
             # Filter out verbose log messages (use the same filtering logic as in SystrayManager)
-            if not self.config.get('debug_mode', False):
-                filter_patterns = [
-                    "Retrying channel update:", 
-                    "Received channel update:", 
-                    "Queuing channel update for after window initialization",
-                    "Applying pending channel update:",
-                    "Found active connection in channel",
-                    "Found active voice client in guild",
-                    "Target user is in voice channel:",
-                    "Already connected to channel",
-                    "Successfully connected to voice channel",
-                    "Error cleaning up temp file:",
-                    "Processing command: callback with args:",
-                    "Error getting latency:",
-                    "Voice latency is infinity or NaN, setting to 0"
-                ]
-                for pattern in filter_patterns:
-                    if pattern in message:
-                        return  # Skip logging this message
-            
-            # Add timestamp to message
-            timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            formatted_message = f"[{timestamp}] {message}\n"
-            
-            # If log_text widget doesn't exist yet, store in buffer
-            if not hasattr(self, 'log_text') or not self.log_text:
-                self._log_buffer.append(formatted_message)
-                return
-                
-            # Update log in UI thread
-            if hasattr(self, 'root'):
-                self.root.after(0, self._append_log, formatted_message)
+            if not self._debug_mode:
+                if LOG_FILTER_RE.search(message):
+                    return  # Skip logging this message
+            elif "Found active connection in channel" in message:
+                return  # Never shown, even in debug mode
+            
+            # Add timestamp to message, formatted once per second
+            sec = int(time.time())
+            if sec != self._ts_sec:
+                self._ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+                self._ts_sec = sec
+            formatted_message = f"[{self._ts_str}] {message}\n"
+            
+            # Buffer the line; the UI thread shows buffered lines in batches every 150 ms
+            # (or when the log widget is created)
+            self._log_buffer.append(formatted_message)
+            if not self._log_flush_scheduled and self.log_text and self.root is not None:
+                self._log_flush_scheduled = True
+                self.root.after(150, self._flush_logs)
         except Exception as e:
+            self._log_flush_scheduled = False
             print(f"Error adding log: {e}")  # Fallback to print since logging might be broken
             
-    def _append_log(self, message: str):
-        """Append a message to the log text widget (must be called from UI thread)"""
+    def _flush_logs(self):
+        """Append all buffered log lines to the log text widget (must be called from UI thread)"""
+        # Cleared first so lines added from now on schedule another flush
+        self._log_flush_scheduled = False
+        if not self.log_text or not self._log_buffer:
+            return
         try:
-            # Direct filter at append time to catch any messages that slipped through
-            if "Found active connection in channel" in message:
-                return
+            lines = []
+            while self._log_buffer:
+                lines.append(self._log_buffer.popleft())
                 
             self.log_text.config(state='normal')
             
-            # Check if this is a warning message
-            if "WARNING:" in message:
-                # Insert with the warning tag
-                self.log_text.insert('end', message, "warning")
-            else:
-                # Normal log entry
-                self.log_text.insert('end', message)
+            # Group consecutive lines that share a tag so the whole batch goes in with a
+            # single tagged insert: insert('end', text1, tags1, text2, tags2, ...)
+            chunks = []
+            run = []
+            run_tag = ()
+            for message in lines:
+                tag = ("warning",) if "WARNING:" in message else ()
+                if tag != run_tag and run:
+                    chunks.extend((''.join(run), run_tag))
+                    run = []
+                run.append(message)
+                run_tag = tag
+            chunks.extend((''.join(run), run_tag))
+            self.log_text.insert('end', *chunks)
+            
+            # Drop the oldest lines beyond the cap (the last line is the empty one after the final newline)
+            line_no = int(self.log_text.index('end-1c').split('.')[0])
+            if line_no > LOG_MAX_LINES:
+                self.log_text.delete('1.0', f'{line_no - LOG_MAX_LINES + 1}.0')
                 
-            self.log_text.see('end')
+            # Scroll once for the batch; Tk redraws once when it is next idle
+            self.log_text.yview_moveto(1.0)
             self.log_text.config(state='disabled')
         except Exception as e:
             print(f"Error appending log: {e}")  # Fallback to print since logging might be broken
@@ -693,70 +821,44 @@ class StatusWindow:
     def _on_mute_click(self):
         """Handle PTT toggle button click"""
         if self.on_mute_toggle:
-            self.command_queue.put(('callback', lambda: self.on_mute_toggle('toggle_ptt')))
+            self.post_command('callback', lambda: self.on_mute_toggle('toggle_ptt'))
 
     def _on_join_click(self):
         """Handle join channel button click"""
         if self.on_join_channel:
-            self.command_queue.put(('callback', self.on_join_channel))
+            self.post_command('callback', self.on_join_channel)
             
     def _on_leave_click(self):
         """Handle leave channel button click"""
         if self.on_leave_channel:
-            self.command_queue.put(('callback', self.on_leave_channel))
+            self.post_command('callback', self.on_leave_channel)
             
     def _on_led_test(self):
         """Handle LED test button click"""
-        if hasattr(self, 'on_led_test'):
-            self.command_queue.put(('callback', self.on_led_test))
+        if self.on_led_test is not None:
+            self.post_command('callback', self.on_led_test)
             
+    def set_debug_mode(self, enabled: bool):
+        """Update the cached debug flag after config['debug_mode'] changes elsewhere"""
+        self._debug_mode = bool(enabled)
+        
     def _on_debug_toggle(self):
         """Handle debug mode toggle"""
         if self.on_debug_toggle:
-            self.command_queue.put(('callback', self.on_debug_toggle))
+            self.post_command('callback', self.on_debug_toggle)
             
-    def _process_commands(self):
-        """Process commands from the queue"""
-        try:
-            # Update uptime
-            if hasattr(self, 'start_time') and hasattr(self, 'uptime_var'):
-                uptime = datetime.datetime.now() - self.start_time
-                hours = int(uptime.total_seconds() // 3600)
-                minutes = int((uptime.total_seconds() % 3600) // 60)
-                seconds = int(uptime.total_seconds() % 60)
-                self.uptime_var.set(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
-            
-            # Process all pending commands
-            while True:
-                try:
-                    cmd, args = self.command_queue.get_nowait()
-                    if cmd == 'show' and not self.is_visible:
-                        self.window.deiconify()
-                        self.is_visible = True
-                    elif cmd == 'hide' and self.is_visible:
-                        self.window.withdraw()
-                        self.is_visible = False
-                    elif cmd == 'status':
-                        self.status_var.set(args)
-                    elif cmd == 'channel':
-                        self.channel_var.set(args)
-                    elif cmd == 'log' and self.log_text:
-                        self.log_text.config(state='normal')
-                        self.log_text.insert('end', args + '\n')
-                        self.log_text.see('end')
-                        self.log_text.config(state='disabled')
-                    elif cmd == 'callback':
-                        args()  # Execute the callback function
-                except queue.Empty:
-                    break
-                    
-        except Exception as e:
-            self.debug_print(f"Error processing commands: {e}")
-            
-        finally:
-            # Schedule next check if window exists
-            if self.window:
-                self.window.after(100, self._process_commands)
+    def _refresh_uptime(self):
+        """Show the uptime, touching uptime_var only when the whole second changes"""
+        if self.uptime_var is None:
+            return
+        total_seconds = int((datetime.datetime.now() - self.start_time).total_seconds())
+        if total_seconds == self._last_uptime_seconds:
+            return
+        self._last_uptime_seconds = total_seconds
+        hours = total_seconds // 3600
+        minutes = (total_seconds % 3600) // 60
+        seconds = total_seconds % 60
+        self.uptime_var.set(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
             
     def show(self):
         """Show the status window"""
@@ -764,7 +866,7 @@ class StatusWindow:
         if not self.root:
             self.debug_print("Error: UI not initialized")
             return
-        self.root.after(0, lambda: self.command_queue.put(('show', None)))
+        self.post_command('show')
             
     def hide(self):
         """Hide the status window"""
@@ -772,7 +874,7 @@ class StatusWindow:
         if not self.root:
             self.debug_print("Error: UI not initialized")
             return
-        self.root.after(0, lambda: self.command_queue.put(('hide', None)))
+        self.post_command('hide')
             
     def toggle(self):
         """Toggle window visibility"""
@@ -793,36 +895,40 @@ class StatusWindow:
                 self._process_status_update(status)
                 return
                 
-            if not hasattr(self, 'root') or not self.root:
+            if self.root is None:
                 self._pending_status_updates.append(status)
                 return
                 
             def update():
                 try:
-                    if hasattr(self, 'status_var') and self.status_var:
-                        self.status_var.set(status)
+                    if self.status_var is not None:
+                        self._set_var(self.status_var, status)
                         
                     if "connected" in status.lower() and "dis" not in status.lower():
-                        if hasattr(self, 'status_label') and self.status_label:
+                        if self.status_label is not None:
                             self.status_label.configure(foreground='green')
                         self._update_status_indicator('green')
                         self.is_connected = True
                         
                     elif "error" in status.lower() or "disconnected" in status.lower() or "dis" in status.lower():
-                        if hasattr(self, 'status_label') and self.status_label:
+                        if self.status_label is not None:
                             self.status_label.configure(foreground='red')
                         self._update_status_indicator('red')
                         self.is_connected = False
                         
                     # Fix: Ensure status updates correctly in more situations
-                    elif "initializing" in status.lower() and hasattr(self, 'voice_channel_var') and self.voice_channel_var.get() != "Not connected":
+                    elif "initializing" in status.lower() and self.voice_channel_var is not None and self.voice_channel_var.get() != "Not connected":
                         # If we're showing initializing but we have a voice channel, we're actually connected
-                        if hasattr(self, 'status_label') and self.status_label:
+                        if self.status_label is not None:
                             self.status_label.configure(foreground='green')
                         self._update_status_indicator('green')
-                        self.status_var.set("Connected to Discord")
+                        self._set_var(self.status_var, "Connected to Discord")
                         self.is_connected = True
                         
+                    # Let the caller know the status is now on screen
+                    if self.on_status_applied:
+                        self.on_status_applied(status)
+                        
                 except Exception as e:
                     self.debug_print(f"Error in status update: {e}")
                     
@@ -831,10 +937,15 @@ class StatusWindow:
         except Exception as e:
             self.debug_print(f"Error scheduling status update: {e}")
 
+    def _set_var(self, var, value):
+        """Set a Tk variable only when the value changes, saving the trace and redraw otherwise"""
+        if var.get() != value:
+            var.set(value)
+            
     def _update_status_indicator(self, color: str):
         """Update the status indicator color"""
         try:
-            if hasattr(self, 'status_indicator') and self.status_indicator:
+            if self.status_indicator is not None:
                 try:
                     self.status_indicator.configure(bg=color)
                 except Exception as e:
@@ -842,7 +953,7 @@ class StatusWindow:
                     if "'NoneType' object has no attribute 'configure'" not in str(e):
                         self.debug_print(f"Error configuring status indicator: {e}")
                     
-            if hasattr(self, 'status_light') and self.status_light:
+            if self.status_light is not None:
                 try:
                     self.status_light.configure(bg=color)
                 except Exception as e:
@@ -857,35 +968,35 @@ class StatusWindow:
     def update_channel(self, channel: str):
         """Update channel info"""
         try:
-            if not hasattr(self, 'root') or not self.root:
+            if self.root is None:
                 # Store update for later
                 if not hasattr(self, '_pending_channel_updates'):
                     self._pending_channel_updates = []
                 self._pending_channel_updates.append(channel)
                 return
                 
-            if not hasattr(self, 'channel_var') or not self.channel_var:
+            if self.channel_var is None:
                 self.debug_print("Channel variable not initialized yet")
                 return
             
             def update():
                 try:
-                    if hasattr(self, 'channel_var') and self.channel_var:
-                        self.channel_var.set(channel)
+                    if self.channel_var is not None:
+                        self._set_var(self.channel_var, channel)
                         
                     if channel != "Not connected":
                         # If we have a channel, we're definitely connected
-                        if hasattr(self, 'channel_label') and self.channel_label:
+                        if self.channel_label is not None:
                             try:
                                 self.channel_label.configure(foreground='green')
                             except Exception as e:
                                 if "'NoneType' object has no attribute 'configure'" not in str(e):
                                     self.debug_print(f"Error configuring channel label: {e}")
                         
-                        if hasattr(self, 'status_var') and self.status_var:
-                            self.status_var.set("Connected to Discord")
+                        if self.status_var is not None:
+                            self._set_var(self.status_var, "Connected to Discord")
                             
-                        if hasattr(self, 'status_label') and self.status_label:
+                        if self.status_label is not None:
                             try:
                                 self.status_label.configure(foreground='green')
                             except Exception as e:
@@ -896,20 +1007,20 @@ class StatusWindow:
                         self.is_connected = True
                         
                         # Also update voice connection display
-                        if hasattr(self, 'voice_channel_var') and self.voice_channel_var:
-                            self.voice_channel_var.set(channel)
+                        if self.voice_channel_var is not None:
+                            self._set_var(self.voice_channel_var, channel)
                             
-                        if hasattr(self, 'voice_channel_label') and self.voice_channel_label:
+                        if self.voice_channel_label is not None:
                             try:
                                 self.voice_channel_label.configure(foreground='green')
                             except Exception as e:
                                 if "'NoneType' object has no attribute 'configure'" not in str(e):
                                     self.debug_print(f"Error configuring voice channel label: {e}")
                                     
-                        if hasattr(self, 'quality_var') and self.quality_var:
-                            self.quality_var.set("Good")
+                        if self.quality_var is not None:
+                            self._set_var(self.quality_var, "Good")
                             
-                        if hasattr(self, 'quality_label') and self.quality_label:
+                        if self.quality_label is not None:
                             try:
                                 self.quality_label.configure(foreground='green')
                             except Exception as e:
@@ -917,27 +1028,27 @@ class StatusWindow:
                                     self.debug_print(f"Error configuring quality label: {e}")
                     else:
                         # Not connected
-                        if hasattr(self, 'channel_label') and self.channel_label:
+                        if self.channel_label is not None:
                             try:
                                 self.channel_label.configure(foreground='red')
                             except Exception as e:
                                 if "'NoneType' object has no attribute 'configure'" not in str(e):
                                     self.debug_print(f"Error configuring channel label: {e}")
                                     
-                        if hasattr(self, 'voice_channel_var') and self.voice_channel_var:
-                            self.voice_channel_var.set("Not connected")
+                        if self.voice_channel_var is not None:
+                            self._set_var(self.voice_channel_var, "Not connected")
                             
-                        if hasattr(self, 'voice_channel_label') and self.voice_channel_label:
+                        if self.voice_channel_label is not None:
                             try:
                                 self.voice_channel_label.configure(foreground='red')
                             except Exception as e:
                                 if "'NoneType' object has no attribute 'configure'" not in str(e):
                                     self.debug_print(f"Error configuring voice channel label: {e}")
                                     
-                        if hasattr(self, 'quality_var') and self.quality_var:
-                            self.quality_var.set("Disconnected")
+                        if self.quality_var is not None:
+                            self._set_var(self.quality_var, "Disconnected")
                             
-                        if hasattr(self, 'quality_label') and self.quality_label:
+                        if self.quality_label is not None:
                             try:
                                 self.quality_label.configure(foreground='red')
                             except Exception as e:
@@ -953,24 +1064,6 @@ class StatusWindow:
         except Exception as e:
             self.debug_print(f"Error updating channel: {e}")
             
-    def _update_uptime(self):
-        """Update uptime counter"""
-        try:
-            if hasattr(self, '_start_time') and hasattr(self, 'root') and self.root:
-                elapsed = int(time.time() - self._start_time)
-                hours = elapsed // 3600
-                minutes = (elapsed % 3600) // 60
-                seconds = elapsed % 60
-                
-                if hasattr(self, 'uptime_var'):
-                    self.uptime_var.set(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
-                    
-                # Schedule next update using root.after
-                self._uptime_after = self.root.after(1000, self._update_uptime)
-                
-        except Exception as e:
-            self.debug_print(f"Error updating uptime: {e}")
-            
     def cleanup(self):
         """Clean up resources and shutdown the UI thread"""
         try:
@@ -991,112 +1084,26 @@ class StatusWindow:
             # Force flag to indicate we're in cleanup mode
             self._in_cleanup = True
             
-            # Set exit flag if exists
-            if not hasattr(self, 'exit_flag'):
-                self.exit_flag = threading.Event()
+            # Set exit flag
             self.exit_flag.set()
+            # Wake the stats sampler if it is idling for the window to be shown
+            self._stats_wanted.set()
             
             # Clear the command queue 
-            while not self.command_queue.empty():
-                try:
-                    self.command_queue.get_nowait()
-                except queue.Empty:
-                    break
-            
-            # Save string var references
-            tk_vars = []
-            
-            # Detach all Tkinter variables from the interpreter
-            if hasattr(self, 'root') and self.root:
-                try:
-                    # Collect all Tkinter variables
-                    for attr_name in dir(self):
-                        if attr_name.startswith('__'):
-                            continue
-                            
-                        try:
-                            attr = getattr(self, attr_name)
-                            if isinstance(attr, tk.Variable):
-                                tk_vars.append((attr_name, attr))
-                        except:
-                            pass
-                    
-                    # First, clear all trace callbacks
-                    for _, var in tk_vars:
-                        try:
-                            # Get all trace information
-                            try:
-                                traces = var.trace_info()
-                                for mode, cbname in traces:
-                                    try:
-                                        var.trace_remove(mode, cbname)
-                                    except:
-                                        pass
-                            except:
-                                pass
-                            
-                            # Try to set to empty value to avoid errors
-                            try:
-                                if isinstance(var, tk.StringVar):
-                                    var.set("")
-                                elif isinstance(var, tk.BooleanVar):
-                                    var.set(False)
-                                elif isinstance(var, tk.IntVar):
-                                    var.set(0)
-                            except:
-                                pass
-                        except:
-                            pass
-                except:
-                    pass
+            self.command_queue.clear()
             
-            # IMPORTANT: First destroy root window directly from this thread
-            # This is more reliable than scheduling it through the event loop
-            if hasattr(self, 'root') and self.root:
+            # Wake the mainloop now rather than on the next exit check; _run_ui then
+            # destroys the Tk objects on the UI thread once the loop returns
+            if self.root is not None:
                 try:
-                    self.debug_print("Destroying root window")
-                    
-                    # Ensure all windows are withdrawn first
-                    if hasattr(self, 'window') and self.window:
-                        try:
-                            self.window.withdraw()
-                        except:
-                            pass
-                            
-                    self.root.withdraw()
-                    
-                    # Attempt a clean shutdown of Tkinter
-                    try:
-                        self.root.quit()
-                        self.root.update()  # Process any pending events
-                    except:
-                        pass
-                        
-                    try:
-                        self.root.destroy()
-                    except Exception as e:
-                        self.debug_print(f"Error destroying root: {e}")
+                    self.root.after(0, self.root.quit)
                 except Exception as e:
-                    self.debug_print(f"Error destroying root: {e}")
-            
-            # Now set Tkinter variables to None after root is destroyed
-            # This breaks their connection to the Tk interpreter
-            for attr_name, _ in tk_vars:
-                try:
-                    setattr(self, attr_name, None)
-                except:
-                    pass
-            
-            # Wait briefly for UI thread to notice the window is gone
-            time.sleep(0.1)
-            
-            # Now aggressively terminate the UI thread if it's still alive
-            if hasattr(self, 'ui_thread') and self.ui_thread and self.ui_thread.is_alive():
-                try:
-                    self.debug_print("UI thread still alive, attempting to join with timeout")
-                    self.ui_thread.join(timeout=0.5)
+                    self.debug_print(f"Error stopping UI mainloop: {e}")
                     
-                    # If still alive, handle differently depending on platform
+            if (hasattr(self, 'ui_thread') and self.ui_thread and self.ui_thread.is_alive()
+                    and self.ui_thread is not threading.current_thread()):
+                try:
+                    self.ui_thread.join(timeout=1.0)
                     if self.ui_thread.is_alive():
                         self.debug_print("WARNING: UI thread won't terminate normally")
                         # We've done our best to clean up - the rest will be handled by os._exit
@@ -1140,6 +1147,8 @@ class StatusWindow:
             self.on_disconnect = None
             self.on_reconnect = None
             self.on_chat_message = None
+            self.on_status_applied = None
+            self.on_config_changed = None
             
             self.debug_print("Status window cleanup completed")
             
@@ -1150,9 +1159,22 @@ class StatusWindow:
             sys.excepthook = original_excepthook
             
             # Ensure all UI elements are cleared
-            if hasattr(self, 'root'):
+            if self.root is not None:
                 self.root = None
 
+    def _destroy_ui(self):
+        """Release the Tk variables and destroy the root window (must be called from UI thread)"""
+        try:
+            # Drop our Variables while the interpreter is still alive so they unset
+            # themselves here instead of being finalized from another thread later
+            for attr_name in [name for name, value in vars(self).items() if isinstance(value, tk.Variable)]:
+                setattr(self, attr_name, None)
+                
+            if self.root is not None:
+                self.root.destroy()
+        except Exception as e:
+            self.debug_print(f"Error destroying UI: {e}")
+            
     def _on_disconnect_click(self):
         """Handle disconnect button click"""
         if self.on_disconnect:
@@ -1174,20 +1196,19 @@ class StatusWindow:
                 x = self.window.winfo_x()
                 y = self.window.winfo_y()
                 self.config['window_position'] = {'x': x, 'y': y}
-                with open('config.json', 'w') as f:
-                    json.dump(self.config, f, indent=4)
+                self._save_config()
         except Exception as e:
             self.debug_print(f"Error saving window position on exit: {e}")
             
         # Call exit callback if exists
         if hasattr(self, 'on_exit'):
-            self.command_queue.put(('callback', self.on_exit))
+            self.post_command('callback', self.on_exit)
         else:
             self.window.quit()
             
     def _on_test_announcement(self):
         """Handle test announcement button"""
-        if hasattr(self, 'on_test_announcement') and self.on_test_announcement:
+        if self.on_test_announcement is not None:
             self.debug_print("Sending test announcement command")
             
             def test_announcement_with_error_handling():
@@ -1195,7 +1216,7 @@ class StatusWindow:
                     # Call the callback
                     self.on_test_announcement()
                     # Show success message after a short delay to let the announcement process start
-                    if hasattr(self, 'root'):
+                    if self.root is not None:
                         self.root.after(500, lambda: tkinter.messagebox.showinfo(
                             "Test Announcement", 
                             "Announcement test initiated. Please check logs for details."
@@ -1203,14 +1224,14 @@ class StatusWindow:
                 except Exception as e:
                     error_msg = f"Error testing announcement: {str(e)}"
                     self.debug_print(error_msg)
-                    if hasattr(self, 'root'):
+                    if self.root is not None:
                         self.root.after(0, lambda: tkinter.messagebox.showerror(
                             "Announcement Error", 
                             error_msg
                         ))
             
             # Add to command queue
-            self.command_queue.put(('callback', test_announcement_with_error_handling))
+            self.post_command('callback', test_announcement_with_error_handling)
             
     def _on_chat_send(self):
         """Handle chat send button click"""
@@ -1225,12 +1246,12 @@ class StatusWindow:
         self.add_to_chat("You", message)
         
         # Send to callback if exists
-        if hasattr(self, 'on_chat_message') and self.on_chat_message:
+        if self.on_chat_message is not None:
             try:
                 # The issue is here - the lambda captures reference to message which might change
                 # Create a fixed value to avoid capturing a changing reference
                 msg = message  # Create a copy to ensure the value is fixed
-                self.command_queue.put(('callback', lambda: self.on_chat_message('chat_message', msg)))
+                self.post_command('callback', lambda: self.on_chat_message('chat_message', msg))
             except Exception as e:
                 self.debug_print(f"Error sending chat message: {e}")
                 self.add_to_chat("System", f"Error sending message: {e}")
@@ -1283,7 +1304,7 @@ class StatusWindow:
             
         except Exception as e:
             self.debug_print(f"Error adding chat message: {e}")
-            if hasattr(self, 'window') and self.window:
+            if self.window is not None:
                 try:
                     # Try to show error in a message box
                     tk.messagebox.showerror("Chat Error", f"Error adding message to chat: {e}")
@@ -1414,8 +1435,8 @@ class StatusWindow:
             
         try:
             color = self.config.get('led_colors', {}).get(key, {})
-            if hasattr(self, 'on_led_test'):
-                self.command_queue.put(('callback', lambda: self.on_led_test(key, color)))
+            if self.on_led_test is not None:
+                self.post_command('callback', lambda: self.on_led_test(key, color))
         except Exception as e:
             self.debug_print(f"Error testing LED color: {e}")
             
@@ -1434,16 +1455,18 @@ class StatusWindow:
                 self.config['led_colors'][key] = new_color
                 # Save to file
                 try:
-                    with open('config.json', 'w') as f:
-                        json.dump(self.config, f, indent=4)
+                    self._save_config()
                     self.debug_print(f"Saved new color for {key}")
+                    # The bot and its audio sinks hold resolved LED colors; rebind them
+                    if self.on_config_changed:
+                        self.on_config_changed()
                 except Exception as e:
                     self.debug_print(f"Error saving config: {e}")
                     
             def test_color(color):
                 """Test the current color configuration"""
-                if hasattr(self, 'on_led_test'):
-                    self.command_queue.put(('callback', lambda: self.on_led_test(key, color)))
+                if self.on_led_test is not None:
+                    self.post_command('callback', lambda: self.on_led_test(key, color))
                     
             # Create color config window
             LEDColorConfig(self.window, f"{label} Color", current_color,
@@ -1457,8 +1480,10 @@ class StatusWindow:
         """Handle LED enable/disable toggle"""
         enabled = self.led_enabled_var.get()
         self.config['led_enabled'] = enabled
+        if self.on_config_changed:
+            self.on_config_changed()
         if hasattr(self, 'on_led_toggle'):
-            self.command_queue.put(('callback', lambda: self.on_led_toggle(enabled)))
+            self.post_command('callback', lambda: self.on_led_toggle(enabled))
             
     def _on_announcement_save(self):
         """Handle announcement configuration save"""
@@ -1470,9 +1495,10 @@ class StatusWindow:
             self.config['announcement_minute'] = int(self.minute_var.get())
             
             # Save config to file
-            with open('config.json', 'w') as f:
-                json.dump(self.config, f, indent=4)
+            self._save_config()
             self.debug_print("Announcement settings saved to file")
+            if self.on_config_changed:
+                self.on_config_changed()
             
         except Exception as e:
             self.debug_print(f"Error saving announcement settings: {e}")
@@ -1488,7 +1514,7 @@ class StatusWindow:
     def update_voice_channel(self, status: str, is_connected: bool = False):
         """Update the voice channel status"""
         try:
-            if not hasattr(self, 'root') or not self.root:
+            if self.root is None:
                 # Store for later application
                 if not hasattr(self, '_pending_voice_updates'):
                     self._pending_voice_updates = []
@@ -1502,20 +1528,20 @@ class StatusWindow:
                         self.start_time = datetime.datetime.now()
                         self.uptime_var.set("00:00:00")
                     
-                    if hasattr(self, 'voice_channel_var') and self.voice_channel_var:
+                    if self.voice_channel_var is not None:
                         self.voice_channel_var.set(status)
                         
-                    if hasattr(self, 'voice_channel_label') and self.voice_channel_label:
+                    if self.voice_channel_label is not None:
                         try:
                             self.voice_channel_label.configure(foreground='green' if is_connected else 'red')
                         except Exception as e:
                             if "'NoneType' object has no attribute 'configure'" not in str(e):
                                 self.debug_print(f"Error configuring voice channel label: {e}")
                                 
-                    if hasattr(self, 'quality_var') and self.quality_var:
+                    if self.quality_var is not None:
                         self.quality_var.set("Good" if is_connected else "Disconnected")
                         
-                    if hasattr(self, 'quality_label') and self.quality_label:
+                    if self.quality_label is not None:
                         try:
                             self.quality_label.configure(foreground='green' if is_connected else 'red')
                         except Exception as e:
@@ -1523,16 +1549,16 @@ class StatusWindow:
                                 self.debug_print(f"Error configuring quality label: {e}")
                     
                     # If disconnecting, also reset the latency
-                    if not is_connected and hasattr(self, 'latency_var'):
+                    if not is_connected and self.latency_var is not None:
                         self.latency_var.set("N/A")
                         self.debug_print("Reset latency display to N/A on disconnect")
                     
                     # Also synchronize the status information
                     if is_connected:
-                        if hasattr(self, 'status_var') and self.status_var:
+                        if self.status_var is not None:
                             self.status_var.set("Connected to Discord")
                             
-                        if hasattr(self, 'status_label') and self.status_label:
+                        if self.status_label is not None:
                             try:
                                 self.status_label.configure(foreground='green')
                             except Exception as e:
@@ -1557,12 +1583,12 @@ class StatusWindow:
 
     def show_error(self, title: str, message: str):
         """Show an error popup message"""
-        if hasattr(self, 'root'):
+        if self.root is not None:
             self.root.after(0, lambda: tkinter.messagebox.showerror(title, message))
             
     def show_info(self, title: str, message: str):
         """Show an info popup message"""
-        if hasattr(self, 'root'):
+        if self.root is not None:
             self.root.after(0, lambda: tkinter.messagebox.showinfo(title, message))
 
     def _on_window_move(self, event):
@@ -1575,8 +1601,7 @@ class StatusWindow:
                 self.config['window_position'] = {'x': x, 'y': y}
                 # Save to file
                 try:
-                    with open('config.json', 'w') as f:
-                        json.dump(self.config, f, indent=4)
+                    self._save_config()
                 except Exception as e:
                     self.debug_print(f"Error saving window position: {e}")
                     
@@ -1586,16 +1611,12 @@ class StatusWindow:
             return
             
         try:
-            # Update uptime
-            if hasattr(self, 'start_time') and hasattr(self, 'uptime_var'):
-                uptime = datetime.datetime.now() - self.start_time
-                hours = int(uptime.total_seconds() // 3600)
-                minutes = int((uptime.total_seconds() % 3600) // 60)
-                seconds = int(uptime.total_seconds() % 60)
-                self.uptime_var.set(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
+            # Update uptime (skipped while hidden; it is worked out from start_time on the next tick)
+            if self.is_visible:
+                self._refresh_uptime()
             
             # Only update latency if we don't have actual measurements yet
-            if hasattr(self, 'latency_var') and self.latency_var.get() == "N/A":
+            if self.is_visible and self.latency_var is not None and self.latency_var.get() == "N/A":
                 self.latency_var.set("Measuring...")
         except Exception as e:
             if "'NoneType' object has no attribute" not in str(e):
@@ -1605,35 +1626,57 @@ class StatusWindow:
         if self.root and self.is_connected:
             self.root.after(1000, self._update_connection_monitor)
 
+    def _sample_stats(self):
+        """Sampler thread: read process stats with psutil while the window is shown, until the UI exits"""
+        while True:
+            # Nobody sees the stats while the window is hidden, so sleep until it is shown
+            self._stats_wanted.wait()
+            if self.exit_flag.is_set():
+                break
+            try:
+                # Read all process info in one pass
+                with self._proc.oneshot():
+                    self._stats['mem_mb'] = self._proc.memory_info().rss / 1024 / 1024
+            except Exception as e:
+                self.debug_print(f"Error sampling system stats: {e}")
+                
+            # One sample per display refresh
+            if self.exit_flag.wait(STATS_INTERVAL):
+                break
+                
+
     def _update_system_stats(self):
-        """Update system statistics periodically"""
-        try:
-            process = psutil.Process()
-            
-            # Get memory usage
-            memory_mb = process.memory_info().rss / 1024 / 1024
+        """Update system statistics periodically while the window is visible"""
+        self._stats_after_id = None
+        if not self.is_visible:
+            return
             
-            # Update memory stats
-            if hasattr(self, 'memory_var') and self.memory_var:
-                self.memory_var.set(f"Memory Usage: {memory_mb:.1f} MB")
+        try:
+            # Get memory usage from the sampler thread
+            memory_mb = self._stats['mem_mb']
             
-            if hasattr(self, 'memory_bar') and self.memory_bar:
-                try:
-                    # Update progress bar - max 1024MB for scaling
-                    value = min(memory_mb / 1024 * 100, 100)
-                    self.memory_bar['value'] = value
-                except (AttributeError, TypeError):
-                    # Silently ignore attribute errors for memory_bar
-                    pass
+            # Update memory stats (once the first sample is in)
+            if memory_mb is not None:
+                if self.memory_var is not None:
+                    self._set_var(self.memory_var, f"Memory Usage: {memory_mb:.1f} MB")
+                
+                if self.memory_bar is not None:
+                    try:
+                        # Update progress bar - max 1024MB for scaling
+                        value = min(memory_mb / 1024 * 100, 100)
+                        self.memory_bar['value'] = value
+                    except (AttributeError, TypeError):
+                        # Silently ignore attribute errors for memory_bar
+                        pass
             
             # Update connection status if connected to properly keep UI in sync
-            if hasattr(self, 'voice_channel_var') and self.voice_channel_var and self.voice_channel_var.get() != "Not connected":
+            if self.voice_channel_var is not None and self.voice_channel_var.get() != "Not connected":
                 if hasattr(self, 'is_connected'):
                     self.is_connected = True
                     
-                    if hasattr(self, 'status_var') and self.status_var and "initializing" in self.status_var.get().lower():
-                        self.status_var.set("Connected to Discord")
-                        if hasattr(self, 'status_label') and self.status_label:
+                    if self.status_var is not None and "initializing" in self.status_var.get().lower():
+                        self._set_var(self.status_var, "Connected to Discord")
+                        if self.status_label is not None:
                             try:
                                 self.status_label.configure(foreground='green')
                             except (AttributeError, TypeError):
@@ -1641,26 +1684,24 @@ class StatusWindow:
                                 pass
                         self._update_status_indicator('green')
                     
-                    if hasattr(self, 'quality_var') and self.quality_var:
-                        self.quality_var.set("Good")
-                        if hasattr(self, 'quality_label') and self.quality_label:
+                    if self.quality_var is not None:
+                        self._set_var(self.quality_var, "Good")
+                        if self.quality_label is not None:
                             try:
                                 self.quality_label.configure(foreground='green')
                             except (AttributeError, TypeError):
                                 # Silently ignore attribute errors
                                 pass
             
-            # Schedule next update every 10 seconds (reduced from 2 seconds)
-            if self.root:
-                self.root.after(10000, self._update_system_stats)
-                
         except Exception as e:
             # Only log errors that aren't related to NoneType objects having no attributes
             if "'NoneType' object has no attribute" not in str(e):
                 self.debug_print(f"Error updating system stats: {e}")
-            # Reschedule even on error
-            if self.root:
-                self.root.after(10000, self._update_system_stats)
+                
+        # Schedule next update every STATS_INTERVAL seconds, but only while the window is shown;
+        # the chain is resumed by the 'show' command
+        if self.root and self.is_visible:
+            self._stats_after_id = self.root.after(int(STATS_INTERVAL * 1000), self._update_system_stats)
 
     def _process_status_update(self, status: str):
         """Process a single status update"""
@@ -1703,12 +1744,12 @@ class StatusWindow:
 
     def update_latency(self, latency_ms):
         """Update the latency display with actual measurements"""
-        if not hasattr(self, 'root') or not self.root:
+        if self.root is None:
             return
             
         def update():
             try:
-                if hasattr(self, 'latency_var') and self.latency_var:
+                if self.latency_var is not None:
                     # Format latency nicely
                     if latency_ms > 0:
                         self.latency_var.set(f"{latency_ms} ms")
@@ -1716,9 +1757,9 @@ class StatusWindow:
                         # Special case for disconnected state
                         self.latency_var.set("N/A")
                         # Also ensure quality shows disconnected
-                        if hasattr(self, 'quality_var') and self.quality_var:
+                        if self.quality_var is not None:
                             self.quality_var.set("Disconnected")
-                        if hasattr(self, 'quality_label') and self.quality_label:
+                        if self.quality_label is not None:
                             try:
                                 self.quality_label.configure(foreground='red')
                             except Exception as e:
@@ -212,7 +212,9 @@ class SystrayManager:
             
     def update_status(self, status: str):
         """Update status window"""
-        self.status_window.update_status(status)
+        # Called from the bot's event loop; hand off to the UI thread's queue rather
+        # than making the Tk updates here, which would wait for the Tk thread each time
+        self.status_window.post_command('status', status)
         
     def update_channel(self, channel: str):
         """Update channel info in status window"""
@@ -230,12 +232,8 @@ class SystrayManager:
                 threading.Timer(1.0, retry_update).start()
                 return
             
-            # Update channel information in status window
-            self.status_window.update_channel(channel)
-            
-            # If we have a channel, this implies a voice connection too
-            if channel and channel != "Not connected":
-                self.status_window.update_voice_channel(channel, is_connected=True)
+            # Update channel information (and the voice connection it implies) from the UI thread
+            self.status_window.post_command('channel', channel)
                 
         except Exception as e:
             self.debug_print(f"Error updating channel: {e}")
@@ -259,6 +257,9 @@ class SystrayManager:
         """Handle debug mode toggle"""
         self.config['debug_mode'] = not self.config.get('debug_mode', False)
         self.debug_print(f"Debug mode: {self.config['debug_mode']}")
+        self.status_window.set_debug_mode(self.config['debug_mode'])
+        if 'on_config_changed' in self.callbacks:
+            self.callbacks['on_config_changed']()
         if self.icon:
             self.icon.update_menu()
             
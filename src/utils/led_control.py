@@ -1,13 +1,55 @@
 from blinkstick import blinkstick
+import asyncio
+import threading
 import time
 import logging
-from typing import Optional, Dict, Any, Callable
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Callable, Tuple
+
+logger = logging.getLogger(__name__)
+
+RGB = Tuple[int, int, int]
+
+def _rgb(led_colors: Dict[str, Any], name: str, default: RGB) -> RGB:
+    """Read one led_colors entry as an (red, green, blue) tuple"""
+    color = led_colors.get(name)
+    if color is None:
+        return default
+    return (color.get('red', 0), color.get('green', 0), color.get('blue', 0))
+
+# No slots=True: that needs Python 3.10 and the README supports 3.8+
+@dataclass(frozen=True)
+class LEDConfig:
+    """LED settings resolved from the config dict, rebuilt whenever the config changes"""
+    enabled: bool
+    target_voice: RGB
+    other_voice: RGB
+    hotkey: RGB
+    notification: RGB
+    gpt_activity: RGB
+    power_on: RGB
+    
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'LEDConfig':
+        led_colors = config.get('led_colors', {})
+        return cls(enabled=bool(config.get('led_enabled', False)),
+                   target_voice=_rgb(led_colors, 'target_voice', (255, 0, 0)),
+                   other_voice=_rgb(led_colors, 'other_voice', (0, 0, 255)),
+                   hotkey=_rgb(led_colors, 'hotkey', (60, 0, 0)),
+                   notification=_rgb(led_colors, 'notification', (255, 204, 0)),
+                   gpt_activity=_rgb(led_colors, 'gpt_activity', (128, 0, 128)),
+                   power_on=_rgb(led_colors, 'power_on', (0, 100, 0)))
 
 class LEDController:
     def __init__(self, debug_print_func: Callable = print):
         self.bs = None
         self.debug_print = debug_print_func
         self.target_serial = "BS061825-3.0"  # Target BlinkStick serial
+        # Last color written to each (channel, index), used to skip redundant USB writes
+        self._led_state: Dict[Tuple[int, int], Tuple[int, int, int]] = {}
+        # Serializes device access: the bot's I/O pool, the sinks' LED flush threads and the
+        # LED test all write from their own threads. Reentrant since initialize() calls set_color()
+        self._lock = threading.RLock()
         
     def _log_warning(self, msg: str):
         """Log a message with WARNING level"""
@@ -20,6 +62,13 @@ class LEDController:
         
     def initialize(self) -> bool:
         """Initialize the BlinkStick"""
+        with self._lock:
+            return self._initialize()
+            
+    def _initialize(self) -> bool:
+        """Find and validate the BlinkStick (caller holds self._lock)"""
+        # Device state is unknown after (re)initialization
+        self._led_state.clear()
         try:
             # Find all connected BlinkSticks
             all_sticks = blinkstick.find_all()
@@ -73,6 +122,15 @@ class LEDController:
             
     def set_color(self, channel: int, index: int, red: int, green: int, blue: int) -> bool:
         """Set LED color with error handling and retries"""
+        with self._lock:
+            return self._set_color(channel, index, red, green, blue)
+            
+    def _set_color(self, channel: int, index: int, red: int, green: int, blue: int) -> bool:
+        """Write one LED color (caller holds self._lock)"""
+        # Skip the USB round-trip if the LED already shows this color
+        if self.bs is not None and self._led_state.get((channel, index)) == (red, green, blue):
+            return True
+            
         max_retries = 3
         for attempt in range(max_retries):
             try:
@@ -80,7 +138,10 @@ class LEDController:
                     self.initialize()
                 if self.bs:
                     self.bs.set_color(channel=channel, index=index, red=red, green=green, blue=blue)
-                    self.debug_print(f"LED set: channel={channel}, index={index}, RGB=({red},{green},{blue})")
+                    self._led_state[(channel, index)] = (red, green, blue)
+                    # Called for every voice packet, so keep this lazily formatted and off the UI log
+                    logger.debug("LED set: channel=%d, index=%d, RGB=(%d,%d,%d)",
+                                 channel, index, red, green, blue)
                     return True
             except Exception as e:
                 self.debug_print(f"Attempt {attempt + 1}: Error setting LED color: {e}")
@@ -90,29 +151,37 @@ class LEDController:
     def turn_off(self, channel: int = 0, index: Optional[int] = None) -> None:
         """Turn off LED(s)"""
         try:
-            if index is not None:
-                # Turn off specific LED
-                self.set_color(channel, index, 0, 0, 0)
-            else:
-                # Turn off all LEDs
-                for i in range(8):
-                    self.set_color(channel, i, 0, 0, 0)
+            # Hold the lock across the loop so another writer can't interleave mid-sweep
+            with self._lock:
+                if index is not None:
+                    # Turn off specific LED
+                    self.set_color(channel, index, 0, 0, 0)
+                else:
+                    # Turn off all LEDs
+                    for i in range(8):
+                        self.set_color(channel, i, 0, 0, 0)
         except Exception as e:
             self.debug_print(f"Error turning off LED(s): {e}")
             
-    async def cleanup(self) -> None:
-        """Clean up resources"""
-        try:
-            if self.bs:
-                # Turn off all LEDs
-                self.turn_off()
-                # Clear the reference
+    async def cleanup(self, executor=None) -> None:
+        """Clean up resources; the blocking USB write runs on executor (default: the loop's) to keep it off the event loop"""
+        await asyncio.get_running_loop().run_in_executor(executor, self._cleanup)
+        
+    def _cleanup(self) -> None:
+        """Turn the LEDs off and drop the device (blocking)"""
+        with self._lock:
+            try:
+                if self.bs:
+                    # Turn off all LEDs
+                    self.turn_off()
+                    # Clear the reference
+                    self.bs = None
+            except Exception as e:
+                self.debug_print(f"Error during LED cleanup: {e}")
+            finally:
+                # Ensure bs is None even if there was an error
                 self.bs = None
-        except Exception as e:
-            self.debug_print(f"Error during LED cleanup: {e}")
-        finally:
-            # Ensure bs is None even if there was an error
-            self.bs = None
+                self._led_state.clear()
 
     def test_sequence(self, config: Dict[str, Any]):
         """Run a test sequence showing all configured colors"""